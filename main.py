@@ -5,13 +5,25 @@ Main module for launching the clustering application.
 import sys
 import os
 import argparse
-from PyQt5.QtWidgets import QApplication
-from src.data_processing import DataLoader, DataPreprocessor
-from src.clustering import KMeansClustering, ClusterAnalyzer
-from src.visualization import ClusterVisualizer
-from src.ui import create_app
+import logging
+
+# Numba picks its threading layer on the first parallel kernel launch;
+# OpenMP is preferred, as TBB worker threads keep the process from
+# exiting; set here for this process only, so importing the kernels
+# does not change the configuration of other Numba users
+os.environ.setdefault('NUMBA_THREADING_LAYER_PRIORITY', 'omp tbb workqueue')
+
+from src.ui import create_app, LazyClass
 from src.localization import get_translator, set_language
 
+# Components are imported on first use, keeping scikit-learn, pandas
+# and seaborn out of the startup path
+DataLoader = LazyClass('src.data_processing.data_loader', 'DataLoader')
+DataPreprocessor = LazyClass('src.data_processing.data_preprocessor', 'DataPreprocessor')
+KMeansClustering = LazyClass('src.clustering.kmeans_clustering', 'KMeansClustering')
+ClusterAnalyzer = LazyClass('src.clustering.cluster_analyzer', 'ClusterAnalyzer')
+ClusterVisualizer = LazyClass('src.visualization.cluster_visualizer', 'ClusterVisualizer')
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 def main():
@@ -37,13 +49,18 @@ def main():
     )
     args = parser.parse_args()
     
+    # Report warnings and errors of the application modules
+    logging.basicConfig(level=logging.WARNING, format='%(levelname)s %(name)s: %(message)s')
+    
     # Set language from command line argument
     set_language(args.lang)
     
     # Update translator with the selected language
     translator = get_translator()
     
-    # Initialize application
+    # Initialize application; Qt widgets are imported only once arguments are valid
+    from PyQt5.QtWidgets import QApplication
+    
     app_instance = QApplication(sys.argv)
     clustering_app = create_app(
         DataLoader,
@@ -0,0 +1,573 @@
+"""
+Module with computational kernels for the k-means algorithm.
+"""
+
+import threading
+import numpy as np
+from typing import Callable, Optional, Tuple
+
+try:
+    from numba import njit, prange, get_num_threads
+    NUMBA_AVAILABLE = True
+
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Parallel kernels are called from several pool threads, but Numba's
+# workqueue threading layer aborts on concurrent launches; each kernel
+# already uses all cores, so launches are serialized instead of relying
+# on the threading layer numba picks
+_PARALLEL_LOCK = threading.Lock()
+
+# Feature counts for which the Numba kernel is compiled with a fixed width
+SPECIALIZED_FEATURES = (2, 3, 4, 8, 16)
+
+# Number of rows per tile of the pairwise distance matrix
+SILHOUETTE_TILE_SIZE = 1024
+
+# Finite stand-in for infinity in kernels compiled with fastmath, which
+# lets the compiler assume that no infinities occur
+_FLOAT_MAX = np.finfo(np.float64).max
+
+def squared_norms(X: np.ndarray) -> np.ndarray:
+    """
+    Calculate the squared Euclidean norm of each row.
+
+    Args:
+        X: Input data
+
+    Returns:
+        Array of squared row norms
+    """
+    return np.einsum('ij,ij->i', X, X)
+
+def assign_labels(X: np.ndarray,
+                  centers: np.ndarray,
+                  x_squared_norms: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assign each sample to the nearest center.
+
+    Uses the Numba kernel when Numba is installed. Otherwise uses the
+    expansion ||x - c||² = ||x||² + ||c||² - 2·x·c, so the distance
+    computation is a single matrix product.
+
+    Args:
+        X: Input data
+        centers: Cluster centers
+        x_squared_norms: Precomputed squared norms of the rows of X
+            (not needed by the Numba kernel)
+
+    Returns:
+        Tuple of the label array and the squared distance of each sample to its center
+    """
+
+    if NUMBA_AVAILABLE:
+        X = np.ascontiguousarray(X)
+        with _PARALLEL_LOCK:
+            return _assign_nearest(X, np.ascontiguousarray(centers, dtype=X.dtype))
+
+    c_squared_norms = squared_norms(centers)
+    distances = x_squared_norms[:, None] + c_squared_norms[None, :] - 2 * (X @ centers.T)
+    labels = distances.argmin(axis=1)
+
+    # Rounding errors of the expansion can produce small negative values
+    min_distances = np.maximum(distances[np.arange(len(X)), labels], 0)
+    return labels, min_distances
+
+def update_centers(X: np.ndarray,
+                   labels: np.ndarray,
+                   centers: np.ndarray) -> np.ndarray:
+    """
+    Move each center to the mean of its assigned samples.
+
+    Centers of empty clusters are left in place.
+
+    Args:
+        X: Input data
+        labels: Cluster labels
+        centers: Current cluster centers
+
+    Returns:
+        Updated cluster centers
+    """
+    n_clusters = len(centers)
+    counts = np.bincount(labels, minlength=n_clusters)
+    sums = np.column_stack([
+        np.bincount(labels, weights=X[:, j], minlength=n_clusters)
+        for j in range(X.shape[1])
+    ])
+
+    new_centers = centers.copy()
+    non_empty = counts > 0
+    new_centers[non_empty] = sums[non_empty] / counts[non_empty, None]
+    return new_centers
+
+if NUMBA_AVAILABLE:
+
+    def _make_assign_and_accumulate(fixed_features: int):
+        """
+        Build the fused assignment and accumulation kernel.
+
+        With a nonzero fixed_features the feature count is a compile-time
+        constant of the kernel, so the loops over features are unrolled
+        and the distance computation is vectorized across them.
+
+        Args:
+            fixed_features: Number of features the kernel is specialized
+                for, or 0 for a kernel accepting any number of features
+
+        Returns:
+            Compiled kernel
+        """
+
+        @njit(parallel=True, fastmath=True, cache=True)
+        def _assign_and_accumulate(X, centers, n_chunks):
+            """
+            Assign each sample to the nearest center and accumulate per-cluster sums.
+
+            Samples are split into contiguous chunks, each with its own sums and
+            counts buffers, so parallel iterations never write to the same
+            accumulator; the buffers are merged after the parallel loop.
+
+            Args:
+                X: Input data
+                centers: Cluster centers
+                n_chunks: Number of chunks processed in parallel
+
+            Returns:
+                Tuple of labels, squared distances, per-cluster sums and counts
+            """
+            n_samples = X.shape[0]
+            n_features = fixed_features if fixed_features else X.shape[1]
+            n_clusters = centers.shape[0]
+            chunk_size = (n_samples + n_chunks - 1) // n_chunks
+
+            labels = np.empty(n_samples, dtype=np.int64)
+            distances = np.empty(n_samples, dtype=np.float64)
+            chunk_sums = np.zeros((n_chunks, n_clusters, n_features), dtype=np.float64)
+            chunk_counts = np.zeros((n_chunks, n_clusters), dtype=np.int64)
+
+            for chunk in prange(n_chunks):
+                start = chunk * chunk_size
+                stop = min(start + chunk_size, n_samples)
+
+                for i in range(start, stop):
+                    best = 0
+                    best_distance = _FLOAT_MAX
+
+                    for k in range(n_clusters):
+                        distance = 0.0
+
+                        for j in range(n_features):
+                            diff = X[i, j] - centers[k, j]
+                            distance += diff * diff
+
+                        if distance < best_distance:
+                            best_distance = distance
+                            best = k
+
+                    labels[i] = best
+                    distances[i] = best_distance
+
+                    for j in range(n_features):
+                        chunk_sums[chunk, best, j] += X[i, j]
+
+                    chunk_counts[chunk, best] += 1
+
+            sums = np.zeros((n_clusters, n_features), dtype=np.float64)
+            counts = np.zeros(n_clusters, dtype=np.int64)
+
+            for chunk in range(n_chunks):
+                sums += chunk_sums[chunk]
+                counts += chunk_counts[chunk]
+
+            return labels, distances, sums, counts
+
+        return _assign_and_accumulate
+
+    _assign_and_accumulate = _make_assign_and_accumulate(0)
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _assign_nearest(X, centers):
+        """
+        Assign each sample to the nearest center.
+
+        Distances are summed as (x - c)² per feature rather than through
+        the norm expansion, so they are never negative.
+
+        Args:
+            X: Input data
+            centers: Cluster centers
+
+        Returns:
+            Tuple of labels and squared distances to the assigned centers
+        """
+        n_samples, n_features = X.shape
+        n_clusters = centers.shape[0]
+
+        labels = np.empty(n_samples, dtype=np.int64)
+        distances = np.empty(n_samples, dtype=np.float64)
+
+        for i in prange(n_samples):
+            best = 0
+            best_distance = _FLOAT_MAX
+
+            for k in range(n_clusters):
+                distance = 0.0
+
+                for j in range(n_features):
+                    diff = X[i, j] - centers[k, j]
+                    distance += diff * diff
+
+                if distance < best_distance:
+                    best_distance = distance
+                    best = k
+
+            labels[i] = best
+            distances[i] = best_distance
+
+        return labels, distances
+
+    # Kernels specialized for the most common low feature counts
+    _FIXED_WIDTH_KERNELS = {
+        n_features: _make_assign_and_accumulate(n_features)
+        for n_features in SPECIALIZED_FEATURES
+    }
+
+def _lloyd_numba(X: np.ndarray,
+                 centers: np.ndarray,
+                 max_iter: int,
+                 tol: float) -> Tuple[np.ndarray, np.ndarray, float, int]:
+    """
+    Run Lloyd's algorithm with the fused Numba assignment and update kernel.
+
+    Args:
+        X: Input data
+        centers: Initial cluster centers
+        max_iter: Maximum number of iterations
+        tol: Absolute tolerance on the squared center shift
+
+    Returns:
+        Tuple of labels, cluster centers, inertia and number of iterations run
+    """
+    X = np.ascontiguousarray(X)
+    centers = np.ascontiguousarray(centers, dtype=X.dtype)
+    n_chunks = min(get_num_threads(), len(X))
+    kernel = _FIXED_WIDTH_KERNELS.get(X.shape[1], _assign_and_accumulate)
+    n_iter = 0
+
+    for n_iter in range(1, max_iter + 1):
+        with _PARALLEL_LOCK:
+            labels, _, sums, counts = kernel(X, centers, n_chunks)
+
+        new_centers = centers.copy()
+        non_empty = counts > 0
+        new_centers[non_empty] = sums[non_empty] / counts[non_empty, None]
+        center_shift = np.sum((new_centers - centers) ** 2)
+        centers = new_centers
+
+        if center_shift <= tol:
+            break
+
+    with _PARALLEL_LOCK:
+        labels, distances, _, _ = kernel(X, centers, n_chunks)
+
+    return labels, centers, float(distances.sum()), n_iter
+
+def lloyd(X: np.ndarray,
+          centers: np.ndarray,
+          max_iter: int = 300,
+          tol: float = 1e-4,
+          x_squared_norms: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, float, int]:
+    """
+    Run Lloyd's algorithm from the given initial centers.
+
+    Uses the fused Numba kernel when Numba is installed, otherwise the
+    NumPy assignment and update steps.
+
+    Args:
+        X: Input data
+        centers: Initial cluster centers
+        max_iter: Maximum number of iterations
+        tol: Tolerance on the squared center shift, relative to the mean feature variance
+        x_squared_norms: Precomputed squared norms of the rows of X (computed if None)
+
+    Returns:
+        Tuple of labels, cluster centers, inertia and number of iterations run
+    """
+    tol = tol * np.mean(np.var(X, axis=0))
+
+    if NUMBA_AVAILABLE:
+        return _lloyd_numba(X, centers, max_iter, tol)
+
+    # Contiguous operands of one dtype let X @ centers.T go straight to BLAS gemm
+    X = np.ascontiguousarray(X)
+    centers = np.ascontiguousarray(centers, dtype=X.dtype)
+
+    if x_squared_norms is None:
+        x_squared_norms = squared_norms(X)
+
+    n_iter = 0
+
+    for n_iter in range(1, max_iter + 1):
+        labels, _ = assign_labels(X, centers, x_squared_norms)
+        new_centers = update_centers(X, labels, centers)
+        center_shift = np.sum((new_centers - centers) ** 2)
+        centers = new_centers
+
+        if center_shift <= tol:
+            break
+
+    labels, distances = assign_labels(X, centers, x_squared_norms)
+    return labels, centers, float(distances.sum()), n_iter
+
+def minibatch_lloyd(X: np.ndarray,
+                    centers: np.ndarray,
+                    max_iter: int = 100,
+                    batch_size: int = 1024,
+                    random_state: Optional[np.random.RandomState] = None,
+                    x_squared_norms: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray, float, int]:
+    """
+    Run mini-batch k-means from the given initial centers.
+
+    Each iteration assigns one batch of a single shuffled permutation
+    of the samples and moves every center to the running mean of all
+    samples assigned to it so far.
+
+    Args:
+        X: Input data
+        centers: Initial cluster centers
+        max_iter: Number of batches to process
+        batch_size: Number of samples per batch
+        random_state: Random state used to shuffle the samples
+        x_squared_norms: Precomputed squared norms of the rows of X (computed if None)
+
+    Returns:
+        Tuple of labels, cluster centers, inertia and number of iterations run
+    """
+    X = np.ascontiguousarray(X)
+    centers = np.array(centers, dtype=X.dtype, order='C')
+
+    if x_squared_norms is None:
+        x_squared_norms = squared_norms(X)
+
+    if random_state is None:
+        random_state = np.random.RandomState()
+
+    n_samples = len(X)
+    n_clusters = len(centers)
+    batch_size = min(batch_size, n_samples)
+    n_batches = max(n_samples // batch_size, 1)
+    order = random_state.permutation(n_samples)
+    counts = np.zeros(n_clusters, dtype=np.int64)
+
+    for n_iter in range(max_iter):
+        start = (n_iter % n_batches) * batch_size
+        batch = order[start:start + batch_size]
+        X_batch = X[batch]
+
+        labels, _ = assign_labels(X_batch, centers, x_squared_norms[batch])
+        batch_counts = np.bincount(labels, minlength=n_clusters)
+        batch_sums = update_centers(X_batch, labels, centers) * batch_counts[:, None]
+
+        # Streaming mean over every sample assigned to the cluster so far
+        counts += batch_counts
+        non_empty = batch_counts > 0
+        centers[non_empty] += (
+            batch_sums[non_empty] - batch_counts[non_empty, None] * centers[non_empty]
+        ) / counts[non_empty, None]
+
+    labels, distances = assign_labels(X, centers, x_squared_norms)
+    return labels, centers, float(distances.sum()), max_iter
+
+def silhouette_from_cluster_sums(cluster_sums: np.ndarray,
+                                 inverse: np.ndarray,
+                                 counts: np.ndarray) -> np.ndarray:
+    """
+    Calculate silhouette values from per-cluster distance sums.
+
+    Samples in single-element clusters get a silhouette value of 0,
+    as in sklearn.metrics.silhouette_samples.
+
+    Args:
+        cluster_sums: Sum of the distances from each sample to the samples of each cluster
+        inverse: Cluster index of each sample in 0..n_clusters-1
+        counts: Number of samples in each cluster
+
+    Returns:
+        Array of silhouette values for each data point
+    """
+    rows = np.arange(len(inverse))
+    own_counts = counts[inverse]
+
+    # Mean distance to the other samples of the own cluster
+    with np.errstate(divide='ignore', invalid='ignore'):
+        a = cluster_sums[rows, inverse] / (own_counts - 1)
+
+    # Mean distance to the samples of the nearest other cluster
+    mean_distances = cluster_sums / counts
+    mean_distances[rows, inverse] = np.inf
+    b = mean_distances.min(axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        values = (b - a) / np.maximum(a, b)
+
+    values[own_counts <= 1] = 0
+    return np.nan_to_num(values)
+
+if NUMBA_AVAILABLE:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _silhouette_fused(X, inverse, counts):
+        """
+        Calculate silhouette values, reducing distances as they are computed.
+
+        Each sample's distances are summed per cluster right away, so the
+        pairwise distance matrix is never stored. The nearest other cluster
+        is found with a branchless minimum, the own cluster's mean being
+        replaced by the largest float through a select rather than skipped.
+
+        Args:
+            X: Input data
+            inverse: Cluster index of each sample in 0..n_clusters-1
+            counts: Number of samples in each cluster
+
+        Returns:
+            Array of silhouette values for each data point
+        """
+        n_samples, n_features = X.shape
+        n_clusters = counts.shape[0]
+        cluster_sums = np.zeros((n_samples, n_clusters), dtype=np.float64)
+        values = np.zeros(n_samples, dtype=np.float64)
+
+        for i in prange(n_samples):
+            for j in range(n_samples):
+                distance = 0.0
+
+                for f in range(n_features):
+                    diff = X[i, f] - X[j, f]
+                    distance += diff * diff
+
+                cluster_sums[i, inverse[j]] += np.sqrt(distance)
+
+            own = inverse[i]
+
+            # Samples in single-element clusters keep a silhouette value of 0
+            if counts[own] > 1:
+                a = cluster_sums[i, own] / (counts[own] - 1)
+                b = _FLOAT_MAX
+
+                for k in range(n_clusters):
+                    mean_distance = cluster_sums[i, k] / counts[k]
+                    b = min(b, _FLOAT_MAX if k == own else mean_distance)
+
+                scale = max(a, b)
+
+                if scale > 0:
+                    values[i] = (b - a) / scale
+
+        return values
+
+def silhouette_values_fused(X: np.ndarray,
+                            inverse: np.ndarray,
+                            counts: np.ndarray) -> np.ndarray:
+    """
+    Calculate silhouette values with the fused Numba distance and reduction kernel.
+
+    Requires Numba.
+
+    Args:
+        X: Input data
+        inverse: Cluster index of each sample in 0..n_clusters-1
+        counts: Number of samples in each cluster
+
+    Returns:
+        Array of silhouette values for each data point
+    """
+    with _PARALLEL_LOCK:
+        return _silhouette_fused(np.ascontiguousarray(X), inverse, counts)
+
+def silhouette_values_tiled(X: np.ndarray,
+                            inverse: np.ndarray,
+                            counts: np.ndarray,
+                            squared_distances: Callable[[np.ndarray, np.ndarray], np.ndarray],
+                            tile_size: int = SILHOUETTE_TILE_SIZE) -> np.ndarray:
+    """
+    Calculate silhouette values from tiles of the pairwise distance matrix.
+
+    Each tile of rows is reduced to per-cluster distance sums right away,
+    so only a tile_size x n_samples block is held in memory at a time.
+
+    Args:
+        X: Input data
+        inverse: Cluster index of each sample in 0..n_clusters-1
+        counts: Number of samples in each cluster
+        squared_distances: Function returning the matrix of squared Euclidean
+            distances between the rows of its two arguments
+        tile_size: Number of rows per tile
+
+    Returns:
+        Array of silhouette values for each data point
+    """
+    n_samples = len(X)
+
+    # Indicator matrix turning a tile of distances into per-cluster sums
+    membership = np.zeros((n_samples, len(counts)))
+    membership[np.arange(n_samples), inverse] = 1
+
+    cluster_sums = np.empty((n_samples, len(counts)))
+
+    for start in range(0, n_samples, tile_size):
+        stop = min(start + tile_size, n_samples)
+        distances = np.sqrt(np.maximum(squared_distances(X[start:stop], X), 0))
+        cluster_sums[start:stop] = distances @ membership
+
+    return silhouette_from_cluster_sums(cluster_sums, inverse, counts)
+
+def centroid_scores(X: np.ndarray,
+                    inverse: np.ndarray,
+                    counts: np.ndarray) -> Tuple[float, float]:
+    """
+    Calculate the Calinski-Harabasz and Davies-Bouldin indices.
+
+    Both indices are derived from the same cluster means and
+    sample-to-centroid distances, which are computed once.
+
+    Args:
+        X: Input data
+        inverse: Cluster index of each sample in 0..n_clusters-1
+        counts: Number of samples in each cluster
+
+    Returns:
+        Tuple of the Calinski-Harabasz and Davies-Bouldin indices
+    """
+    X = np.asarray(X, dtype=np.float64)
+    n_samples = len(X)
+    n_clusters = len(counts)
+
+    centroids = np.zeros((n_clusters, X.shape[1]))
+    np.add.at(centroids, inverse, X)
+    centroids /= counts[:, None]
+
+    diff = X - centroids[inverse]
+    squared_distances = np.einsum('ij,ij->i', diff, diff)
+
+    # Calinski-Harabasz: between-cluster over within-cluster dispersion
+    within = squared_distances.sum()
+    between = np.sum(counts * np.sum((centroids - X.mean(axis=0)) ** 2, axis=1))
+    calinski_harabasz = 1.0 if within == 0 else between * (n_samples - n_clusters) / (within * (n_clusters - 1))
+
+    # Davies-Bouldin: mean similarity of each cluster to its most similar one
+    scatter = np.bincount(inverse, weights=np.sqrt(squared_distances), minlength=n_clusters) / counts
+
+    # Direct differences keep the diagonal exactly zero; there are only k x k of them
+    centroid_distances = np.sqrt(np.sum((centroids[:, None, :] - centroids[None, :, :]) ** 2, axis=2))
+
+    if np.allclose(scatter, 0) or np.allclose(centroid_distances, 0):
+        return float(calinski_harabasz), 0.0
+
+    centroid_distances[centroid_distances == 0] = np.inf
+    similarity = (scatter[:, None] + scatter[None, :]) / centroid_distances
+    davies_bouldin = np.mean(np.max(similarity, axis=1))
+
+    return float(calinski_harabasz), float(davies_bouldin)
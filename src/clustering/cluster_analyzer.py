@@ -4,9 +4,78 @@ Module for analyzing clustering results.
 
 import numpy as np
 import pandas as pd
-from typing import Optional, Union, List, Tuple, Dict
+from typing import Optional, Union, List, Tuple, Dict, NamedTuple
 from sklearn.metrics import silhouette_samples
-from collections import Counter
+from ._kernels import NUMBA_AVAILABLE, silhouette_values_fused, silhouette_values_tiled
+
+try:
+    import simsimd
+    SIMSIMD_AVAILABLE = True
+
+except ImportError:
+    SIMSIMD_AVAILABLE = False
+
+def _simsimd_squared_distances(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """
+    Calculate squared Euclidean distances between the rows of A and B with SimSIMD.
+
+    Args:
+        A: First set of points
+        B: Second set of points
+
+    Returns:
+        Matrix of squared distances
+    """
+    return np.asarray(simsimd.cdist(A, B, metric='sqeuclidean'))
+
+# Number of label arrays whose cluster index is kept
+CLUSTER_INDEX_CACHE_SIZE = 4
+
+class ClusterIndex(NamedTuple):
+    """
+    Cluster membership derived from a label array.
+    
+    Attributes:
+        unique: Sorted distinct cluster labels
+        inverse: Position of each sample's label in unique
+        counts: Number of samples in each cluster
+    """
+    unique: np.ndarray
+    inverse: np.ndarray
+    counts: np.ndarray
+
+_cluster_index_cache: Dict[tuple, Tuple[np.ndarray, ClusterIndex]] = {}
+
+def _cluster_index(labels: np.ndarray) -> ClusterIndex:
+    """
+    Get the cluster index of a label array, reusing it across analyzer calls.
+    
+    Entries are keyed on a hash of the contents of the labels and keep
+    a copy of them, which is compared on a hit, so neither a modified
+    array nor a hash collision can return a stale entry.
+    
+    Args:
+        labels: Cluster labels
+        
+    Returns:
+        Cluster index of the labels
+    """
+    labels = np.asarray(labels)
+    key = (labels.dtype.str, labels.shape, hash(labels.tobytes()))
+    entry = _cluster_index_cache.get(key)
+    
+    if entry is not None and np.array_equal(entry[0], labels):
+        return entry[1]
+        
+    unique, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    index = ClusterIndex(unique, inverse.ravel(), counts)
+    
+    # Drop the oldest entry once the cache is full
+    if key not in _cluster_index_cache and len(_cluster_index_cache) >= CLUSTER_INDEX_CACHE_SIZE:
+        _cluster_index_cache.pop(next(iter(_cluster_index_cache)), None)
+        
+    _cluster_index_cache[key] = (labels.copy(), index)
+    return index
 
 class ClusterAnalyzer:
     
@@ -21,7 +90,8 @@ class ClusterAnalyzer:
         Returns:
             Dictionary with the number of elements in each cluster
         """
-        return dict(Counter(labels))
+        index = _cluster_index(labels)
+        return dict(zip(index.unique, index.counts.tolist()))
     
     @staticmethod
     def get_cluster_stats(data: np.ndarray, 
@@ -42,38 +112,48 @@ class ClusterAnalyzer:
         if feature_names is None:
             feature_names = [f"Feature_{i}" for i in range(data.shape[1])]
             
-        # Create DataFrame with data and cluster labels
-        df = pd.DataFrame(data, columns=feature_names)
-        df['cluster'] = labels
+        # Sort samples by cluster so each cluster is one contiguous block
+        unique, inverse, counts = _cluster_index(labels)
+        order = np.argsort(inverse, kind='stable')
+        sorted_data = np.asarray(data, dtype=np.float64)[order]
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
         
-        # Calculate statistics for each cluster
-        stats = []
+        # Missing values are skipped, as in pandas
+        valid = ~np.isnan(sorted_data)
+        n_valid = np.add.reduceat(valid, starts, axis=0)
         
-        for cluster_id in sorted(df['cluster'].unique()):
-            cluster_data = df[df['cluster'] == cluster_id]
-            cluster_stats = {
-                'cluster_id': cluster_id,
-                'size': len(cluster_data),
-                'percentage': len(cluster_data) / len(df) * 100
-            }
-            
-            # Add statistics for each feature
-            for feature in feature_names:
-                feature_values = cluster_data[feature]
-                cluster_stats[f"{feature}_mean"] = feature_values.mean()
-                cluster_stats[f"{feature}_std"] = feature_values.std()
-                cluster_stats[f"{feature}_min"] = feature_values.min()
-                cluster_stats[f"{feature}_max"] = feature_values.max()
-                
-            stats.append(cluster_stats)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = np.add.reduceat(np.where(valid, sorted_data, 0), starts, axis=0) / n_valid
+            
+            # Sample standard deviation from deviations to the cluster means
+            deviations = np.where(valid, sorted_data - np.repeat(means, counts, axis=0), 0)
+            squared_sums = np.add.reduceat(deviations * deviations, starts, axis=0)
+            stds = np.where(n_valid > 1, np.sqrt(squared_sums / (n_valid - 1)), np.nan)
             
-        return pd.DataFrame(stats)
+        mins = np.fmin.reduceat(sorted_data, starts, axis=0)
+        maxs = np.fmax.reduceat(sorted_data, starts, axis=0)
+        
+        # Columns: size, percentage, then mean, std, min and max of each feature
+        feature_stats = np.stack([means, stds, mins, maxs], axis=2).reshape(len(unique), -1)
+        stats = pd.DataFrame(
+            feature_stats,
+            columns=[f"{feature}_{stat}" for feature in feature_names for stat in ('mean', 'std', 'min', 'max')]
+        )
+        stats.insert(0, 'cluster_id', unique)
+        stats.insert(1, 'size', counts)
+        stats.insert(2, 'percentage', counts / len(inverse) * 100)
+        
+        return stats
     
     @staticmethod
     def get_silhouette_values(data: np.ndarray, labels: np.ndarray) -> np.ndarray:
         """
         Calculate silhouette values for each data point.
         
+        Uses the fused Numba kernel when Numba is installed, SimSIMD
+        distance kernels on float32 data when SimSIMD is installed,
+        otherwise sklearn.metrics.silhouette_samples.
+        
         Args:
             data: Original data
             labels: Cluster labels
@@ -82,10 +162,19 @@ class ClusterAnalyzer:
             Array of silhouette values for each data point
         """
 
+        index = _cluster_index(labels)
+        
         # If only one cluster, return zero values
-        if len(np.unique(labels)) <= 1:
+        if len(index.unique) <= 1:
             return np.zeros(len(data))
             
+        if NUMBA_AVAILABLE:
+            return silhouette_values_fused(data, index.inverse, index.counts)
+            
+        if SIMSIMD_AVAILABLE:
+            data = np.ascontiguousarray(data, dtype=np.float32)
+            return silhouette_values_tiled(data, index.inverse, index.counts, _simsimd_squared_distances)
+            
         return silhouette_samples(data, labels)
     
     @staticmethod
@@ -110,25 +199,24 @@ class ClusterAnalyzer:
         if method == 'distance':
 
             # Calculate centroids for each cluster
-            centroids = {}
-
-            for cluster_id in np.unique(labels):
-                cluster_points = data[labels == cluster_id]
-                centroids[cluster_id] = np.mean(cluster_points, axis=0)
+            _, inverse, counts = _cluster_index(labels)
+            centroids = np.zeros((len(counts), data.shape[1]))
+            np.add.at(centroids, inverse, data)
+            centroids /= counts[:, None]
                 
             # Calculate distances to centroids
-            for i, (point, label) in enumerate(zip(data, labels)):
-                distance = np.linalg.norm(point - centroids[label])
-                
-                # Calculate standard deviation of distances for the cluster
-                cluster_points = data[labels == label]
-                cluster_centroid = centroids[label]
-                distances = [np.linalg.norm(p - cluster_centroid) for p in cluster_points]
-                std_distance = np.std(distances)
-                
-                # If distance is greater than threshold * standard deviations, consider point as outlier
-                if distance > threshold * std_distance:
-                    outliers.append(i)
+            diff = data - centroids[inverse]
+            distances = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+            
+            # Calculate standard deviation of distances for each cluster
+            mean_distance = np.bincount(inverse, weights=distances) / counts
+            mean_squared_distance = np.bincount(inverse, weights=distances * distances) / counts
+            std_distance = np.sqrt(np.maximum(mean_squared_distance - mean_distance ** 2, 0))
+            
+            # If distance is greater than threshold * standard deviations, consider point as outlier;
+            # the limit is computed per cluster, so the per-point work is one gather and compare
+            limits = threshold * std_distance
+            outliers = np.flatnonzero(distances > limits[inverse]).tolist()
                     
         elif method == 'silhouette':
             
@@ -2,17 +2,49 @@
 Module implementing the k-means clustering algorithm.
 """
 
+import importlib.util
 import numpy as np
-from typing import Optional, Union, List, Tuple
-from sklearn.cluster import KMeans
-from sklearn.metrics import silhouette_score, calinski_harabasz_score, davies_bouldin_score
+from typing import Optional, Union, List, Tuple, Sequence, Dict
+from joblib import Parallel, delayed, effective_n_jobs, cpu_count
+from threadpoolctl import threadpool_limits
+from sklearn.cluster import KMeans, MiniBatchKMeans, kmeans_plusplus
+from sklearn.metrics import silhouette_score
+from sklearn.utils import check_random_state
+from ._kernels import (
+    NUMBA_AVAILABLE, squared_norms, assign_labels, lloyd, minibatch_lloyd,
+    silhouette_values_fused, centroid_scores
+)
+
+# Implementations of the k-means algorithm and the modules they require
+BACKENDS = {
+    'sklearn': 'sklearn',
+    'numpy': 'numpy',
+    'sklearnex': 'sklearnex',
+    'faiss': 'faiss'
+}
+
+# Number of samples per batch of mini-batch k-means
+MINIBATCH_SIZE = 1024
+
+# The elbow curve only needs approximate inertia, so its fits use a single
+# initialization and a looser convergence tolerance
+ELBOW_N_INIT = 1
+ELBOW_TOL = 1e-3
+
+# Number of samples above which the silhouette score is estimated from a random subset
+SILHOUETTE_MAX_SAMPLES = 10_000
 
 class KMeansClustering:
     
     def __init__(self, 
                 n_clusters: int = 3, 
                 max_iter: int = 300, 
-                random_state: Optional[int] = None):
+                random_state: Optional[int] = None,
+                n_init: int = 10,
+                backend: str = 'sklearn',
+                init: Union[str, np.ndarray] = 'k-means++',
+                use_minibatch: bool = False,
+                tol: float = 1e-4):
         """
         Initialize the KMeansClustering object.
         
@@ -20,35 +52,214 @@ class KMeansClustering:
             n_clusters: Number of clusters
             max_iter: Maximum number of iterations
             random_state: Random state for reproducibility
+            n_init: Number of runs with different initial centers
+            backend: Implementation of the algorithm ('sklearn', 'numpy',
+                'sklearnex' for Intel Extension for Scikit-learn or 'faiss')
+            init: 'k-means++' or an array of initial centers (use n_init=1 with an array)
+            use_minibatch: Update centers from random batches of MINIBATCH_SIZE
+                samples instead of the whole data (not supported by 'faiss')
+            tol: Convergence tolerance on the center shift, relative to the
+                data variance (not used by mini-batch k-means and 'faiss')
         """
+
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown k-means backend: {backend}")
+            
         self.n_clusters = n_clusters
         self.max_iter = max_iter
         self.random_state = random_state
-        self.model = KMeans(
-            n_clusters=n_clusters,
-            max_iter=max_iter,
-            random_state=random_state
-        )
+        self.n_init = n_init
+        self.backend = backend
+        self.init = init
+        self.use_minibatch = use_minibatch
+        self.tol = tol
+        self.model = None
+        
+        # Intel's extension has no mini-batch variant, so both use scikit-learn's
+        if use_minibatch and backend in ('sklearn', 'sklearnex'):
+            self.model = MiniBatchKMeans(
+                n_clusters=n_clusters,
+                batch_size=MINIBATCH_SIZE,
+                max_iter=max_iter,
+                random_state=random_state,
+                n_init=min(n_init, 3),
+                init=init
+            )
+            
+        elif backend == 'sklearn':
+            self.model = KMeans(
+                n_clusters=n_clusters,
+                max_iter=max_iter,
+                random_state=random_state,
+                n_init=n_init,
+                init=init,
+                tol=tol
+            )
+            
+        elif backend == 'sklearnex':
+            from sklearnex.cluster import KMeans as KMeansEx
+            
+            self.model = KMeansEx(
+                n_clusters=n_clusters,
+                max_iter=max_iter,
+                random_state=random_state,
+                n_init=n_init,
+                init=init,
+                tol=tol
+            )
+            
         self.labels_ = None
         self.cluster_centers_ = None
         self.inertia_ = None
         
-    def fit(self, X: np.ndarray) -> 'KMeansClustering':
+    @staticmethod
+    def available_backends() -> List[str]:
+        """
+        Get the backends whose dependencies are installed.
+        
+        Returns:
+            List of backend names
+        """
+        return [name for name, module in BACKENDS.items() if importlib.util.find_spec(module) is not None]
+        
+    @staticmethod
+    def preferred_backend() -> str:
+        """
+        Get the fastest installed backend for general use.
+        
+        Intel's extension is preferred over scikit-learn when installed,
+        as it runs the same algorithm with vectorized kernels.
+        
+        Returns:
+            Backend name
+        """
+        available = KMeansClustering.available_backends()
+        return 'sklearnex' if 'sklearnex' in available else 'sklearn'
+        
+    def fit(self, X: np.ndarray, x_squared_norms: Optional[np.ndarray] = None) -> 'KMeansClustering':
         """
         Train the model on input data.
         
         Args:
             X: Input data for clustering
+            x_squared_norms: Precomputed squared norms of the rows of X, used by
+                the 'numpy' backend (computed if None)
             
         Returns:
             self: Trained model
         """
+
+        if self.backend == 'numpy':
+            return self._fit_lloyd(X, x_squared_norms)
+            
+        if self.backend == 'faiss':
+            return self._fit_faiss(X)
+            
         self.model.fit(X)
         self.labels_ = self.model.labels_
         self.cluster_centers_ = self.model.cluster_centers_
         self.inertia_ = self.model.inertia_
         return self
     
+    def _fit_lloyd(self, X: np.ndarray, x_squared_norms: Optional[np.ndarray] = None) -> 'KMeansClustering':
+        """
+        Train the model with the NumPy implementation of Lloyd's algorithm.
+        
+        Args:
+            X: Input data for clustering
+            x_squared_norms: Precomputed squared norms of the rows of X
+            
+        Returns:
+            self: Trained model
+        """
+        # Keep the dtype of the data (float32 by default since loading) but
+        # make it C-contiguous so distance products dispatch to BLAS gemm
+        X = np.ascontiguousarray(X)
+        
+        # Row norms do not depend on the centers and are shared by all runs
+        if x_squared_norms is None:
+            x_squared_norms = squared_norms(X)
+            
+        random_state = check_random_state(self.random_state)
+        best_inertia = None
+        
+        for _ in range(self.n_init):
+            
+            if isinstance(self.init, np.ndarray):
+                init_centers = self.init
+                
+            else:
+                init_centers, _ = kmeans_plusplus(
+                    X,
+                    self.n_clusters,
+                    x_squared_norms=x_squared_norms,
+                    random_state=random_state
+                )
+                
+            if self.use_minibatch:
+                labels, centers, inertia, _ = minibatch_lloyd(
+                    X,
+                    init_centers,
+                    max_iter=self.max_iter,
+                    batch_size=MINIBATCH_SIZE,
+                    random_state=random_state,
+                    x_squared_norms=x_squared_norms
+                )
+                
+            else:
+                labels, centers, inertia, _ = lloyd(
+                    X,
+                    init_centers,
+                    max_iter=self.max_iter,
+                    tol=self.tol,
+                    x_squared_norms=x_squared_norms
+                )
+            
+            if best_inertia is None or inertia < best_inertia:
+                best_inertia = inertia
+                self.labels_ = labels
+                self.cluster_centers_ = centers
+                
+        self.inertia_ = best_inertia
+        return self
+    
+    def _fit_faiss(self, X: np.ndarray) -> 'KMeansClustering':
+        """
+        Train the model with the faiss implementation of k-means.
+        
+        Args:
+            X: Input data for clustering
+            
+        Returns:
+            self: Trained model
+        """
+        import faiss
+        
+        # faiss works with contiguous float32 data only
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        
+        self.model = faiss.Kmeans(
+            X.shape[1],
+            self.n_clusters,
+            niter=self.max_iter,
+            nredo=self.n_init,
+            seed=self.random_state if self.random_state is not None else 1234,
+            gpu=False
+        )
+        
+        if isinstance(self.init, np.ndarray):
+            self.model.train(X, init_centroids=np.ascontiguousarray(self.init, dtype=np.float32))
+            
+        else:
+            self.model.train(X)
+            
+        
+        distances, labels = self.model.index.search(X, 1)
+        self.labels_ = labels.ravel()
+        self.cluster_centers_ = self.model.centroids
+        self.inertia_ = float(distances.sum())
+        return self
+    
     def predict(self, X: np.ndarray) -> np.ndarray:
         """
         Predict clusters for new data.
@@ -59,6 +270,24 @@ class KMeansClustering:
         Returns:
             Cluster labels for input data
         """
+
+        if self.backend == 'numpy':
+
+            if self.cluster_centers_ is None:
+                raise ValueError("Model is not trained. Call fit() or fit_predict() method first.")
+                
+            X = np.asarray(X)
+            labels, _ = assign_labels(X, self.cluster_centers_, squared_norms(X))
+            return labels
+            
+        if self.backend == 'faiss':
+
+            if self.model is None:
+                raise ValueError("Model is not trained. Call fit() or fit_predict() method first.")
+                
+            _, labels = self.model.index.search(np.ascontiguousarray(X, dtype=np.float32), 1)
+            return labels.ravel()
+            
         return self.model.predict(X)
     
     def fit_predict(self, X: np.ndarray) -> np.ndarray:
@@ -74,13 +303,18 @@ class KMeansClustering:
         self.fit(X)
         return self.labels_
     
-    def evaluate(self, X: np.ndarray, labels: Optional[np.ndarray] = None) -> dict:
+    def evaluate(self,
+                 X: np.ndarray,
+                 labels: Optional[np.ndarray] = None,
+                 silhouette_values: Optional[np.ndarray] = None) -> dict:
         """
         Evaluate clustering quality using various metrics.
         
         Args:
             X: Input data
             labels: Cluster labels (if None, self.labels_ is used)
+            silhouette_values: Already computed silhouette values of all
+                samples of X; their mean is used as the silhouette score
             
         Returns:
             Dictionary with clustering quality metrics
@@ -98,42 +332,258 @@ class KMeansClustering:
         # Inertia (sum of squared distances to the nearest cluster center)
         metrics['inertia'] = self.inertia_
         
+        X = np.asarray(X)
+        labels = np.asarray(labels)
+        _, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+        inverse = inverse.ravel()
+        
         # Clustering quality evaluation (only if number of clusters > 1)
-        if len(np.unique(labels)) > 1:
+        if len(counts) > 1:
 
             # Silhouette Score (from -1 to 1, higher is better)
-            metrics['silhouette_score'] = silhouette_score(X, labels)
+            if silhouette_values is not None:
+                metrics['silhouette_score'] = float(np.mean(silhouette_values))
+                
+            else:
+                metrics['silhouette_score'] = self._silhouette_score(X, labels, inverse, counts)
             
-            # Calinski-Harabasz Index (higher is better)
-            metrics['calinski_harabasz_score'] = calinski_harabasz_score(X, labels)
+            # Calinski-Harabasz Index (higher is better) and Davies-Bouldin
+            # Index (lower is better), both from one set of cluster means
+            (metrics['calinski_harabasz_score'],
+             metrics['davies_bouldin_score']) = centroid_scores(X, inverse, counts)
             
-            # Davies-Bouldin Index (lower is better)
-            metrics['davies_bouldin_score'] = davies_bouldin_score(X, labels)
-        
         return metrics
     
+    def _silhouette_score(self,
+                          X: np.ndarray,
+                          labels: np.ndarray,
+                          inverse: np.ndarray,
+                          counts: np.ndarray) -> float:
+        """
+        Calculate the mean silhouette coefficient.
+        
+        For more than SILHOUETTE_MAX_SAMPLES samples the score is estimated
+        from a random subset of that size, as the exact score is quadratic
+        in the number of samples.
+        
+        Args:
+            X: Input data
+            labels: Cluster labels
+            inverse: Cluster index of each sample in 0..n_clusters-1
+            counts: Number of samples in each cluster
+            
+        Returns:
+            Mean silhouette coefficient
+        """
+        
+        if len(X) > SILHOUETTE_MAX_SAMPLES:
+            return float(silhouette_score(
+                X,
+                labels,
+                sample_size=SILHOUETTE_MAX_SAMPLES,
+                random_state=self.random_state
+            ))
+            
+        if NUMBA_AVAILABLE:
+            return float(np.mean(silhouette_values_fused(X, inverse, counts)))
+            
+        return float(silhouette_score(X, labels))
+    
     def optimal_k_elbow(self, 
                       X: np.ndarray, 
-                      k_range: List[int] = None) -> Tuple[List[int], List[float]]:
+                      k_range: Optional[Sequence[int]] = None,
+                      n_jobs: Optional[int] = None,
+                      x_squared_norms: Optional[np.ndarray] = None,
+                      warm_start: bool = False,
+                      prefer: str = 'threads') -> Tuple[List[int], List[float]]:
         """
         Find the optimal number of clusters using the elbow method.
         
+        Each fit runs ELBOW_N_INIT initializations with tolerance ELBOW_TOL
+        rather than the model's own n_init and tol. k = 1 is not fitted, as
+        its optimal center is the data mean and its inertia the total sum
+        of squared deviations.
+        
         Args:
             X: Input data
-            k_range: Range of k values to test
+            k_range: Sequence of k values to test (1 to 10 if None)
+            n_jobs: Number of k values fitted concurrently (-1 uses all cores,
+                None fits them sequentially)
+            x_squared_norms: Precomputed squared norms of the rows of X, shared
+                by all fits of the 'numpy' backend (computed if None)
+            warm_start: Initialize each fit from the centers of the previous k
+                plus centers sampled with the k-means++ rule; k_range is then
+                split into one contiguous part per job
+            prefer: 'threads' or 'processes'; worker processes receive X as a
+                read-only memory map instead of a pickled copy
             
         Returns:
             Tuple of two lists: k values and corresponding inertia values
         """
 
-        if k_range is None:
-            k_range = list(range(1, 11))
+        k_range = list(range(1, 11)) if k_range is None else list(k_range)
+        X = np.asarray(X)
+            
+        if self.backend == 'numpy' or warm_start:
+            X = np.ascontiguousarray(X)
+            
+            if x_squared_norms is None:
+                x_squared_norms = squared_norms(X)
+                
+        # Centers and inertia of the k values that need no fit
+        known = {}
+        
+        if 1 in k_range:
+            mean = X.mean(axis=0, dtype=np.float64)
+            known[1] = (mean[None, :], float(np.var(X, axis=0, dtype=np.float64).sum() * len(X)))
+                
+        if warm_start:
+            n_parts = min(effective_n_jobs(n_jobs), len(k_range))
+            parts = [list(part) for part in np.array_split(k_range, n_parts)]
+            
+            with self._inner_thread_limits(n_parts, prefer):
+                results = Parallel(n_jobs=n_jobs, prefer=prefer)(
+                    delayed(self._fit_inertia_warm)(X, part, x_squared_norms, known) for part in parts
+                )
+                
+            inertia_values = [inertia for part in results for inertia in part]
+            return k_range, inertia_values
         
+        # Fits for different k are independent; KMeans releases the GIL,
+        # so threads avoid copying X into worker processes by default
+        fitted_k = [k for k in k_range if k not in known]
+        
+        with self._inner_thread_limits(min(effective_n_jobs(n_jobs), len(fitted_k)), prefer):
+            fitted_inertia = Parallel(n_jobs=n_jobs, prefer=prefer)(
+                delayed(self._fit_inertia)(X, k, x_squared_norms) for k in fitted_k
+            )
+            
+        inertia = dict(zip(fitted_k, fitted_inertia))
+            
+        return k_range, [known[k][1] if k in known else inertia[k] for k in k_range]
+    
+    @staticmethod
+    def _inner_thread_limits(n_workers: int, prefer: str) -> threadpool_limits:
+        """
+        Limit the BLAS and OpenMP threads used inside each concurrent fit.
+        
+        Without a limit every fit starts one native thread per core, so
+        n_workers concurrent fits oversubscribe the CPU. Worker processes
+        need no limit here, as joblib already sets one for them.
+        
+        Args:
+            n_workers: Number of fits running concurrently
+            prefer: 'threads' or 'processes', as passed to joblib
+            
+        Returns:
+            Context manager applying the limit (a no-op for a single worker
+            or worker processes)
+        """
+        limit = max(cpu_count() // max(n_workers, 1), 1) if n_workers > 1 and prefer == 'threads' else None
+        return threadpool_limits(limits=limit)
+    
+    def _fit_inertia(self, X: np.ndarray, k: int, x_squared_norms: Optional[np.ndarray] = None) -> float:
+        """
+        Fit a model with k clusters and return its inertia.
+        
+        Args:
+            X: Input data
+            k: Number of clusters
+            x_squared_norms: Precomputed squared norms of the rows of X
+            
+        Returns:
+            Inertia of the fitted model
+        """
+        kmeans = KMeansClustering(
+            n_clusters=k,
+            max_iter=self.max_iter,
+            random_state=self.random_state,
+            n_init=ELBOW_N_INIT,
+            backend=self.backend,
+            use_minibatch=self.use_minibatch,
+            tol=ELBOW_TOL
+        )
+        kmeans.fit(X, x_squared_norms=x_squared_norms)
+        return kmeans.inertia_
+    
+    def _fit_inertia_warm(self,
+                          X: np.ndarray,
+                          k_values: List[int],
+                          x_squared_norms: np.ndarray,
+                          known: Optional[Dict[int, Tuple[np.ndarray, float]]] = None) -> List[float]:
+        """
+        Fit models for consecutive k values, seeding each from the previous one.
+        
+        The centers found for the previous k are kept and the new centers
+        are sampled with the k-means++ rule (probability proportional to
+        the squared distance to the nearest center). The inherited centers
+        can be stuck in a local optimum, so each k is also fitted from a
+        full k-means++ seeding and the fit with the lower inertia is kept
+        and passed on to the next k.
+        
+        Args:
+            X: Input data
+            k_values: Increasing k values
+            x_squared_norms: Precomputed squared norms of the rows of X
+            known: Centers and inertia of k values that are not fitted
+            
+        Returns:
+            Inertia of the fitted model for each k
+        """
         inertia_values = []
+        centers = None
+        random_state = check_random_state(self.random_state)
         
-        for k in k_range:
-            kmeans = KMeans(n_clusters=k, max_iter=self.max_iter, random_state=self.random_state)
-            kmeans.fit(X)
-            inertia_values.append(kmeans.inertia_)
+        for k in k_values:
+            
+            if known and k in known:
+                centers, inertia = known[k]
+                inertia_values.append(inertia)
+                continue
+                
+            if centers is None or k <= len(centers):
+                init = 'k-means++'
+                
+            else:
+                _, distances = assign_labels(X, centers, x_squared_norms)
+                new_centers = []
+                
+                for _ in range(k - len(centers)):
+                    cumulative = np.cumsum(distances)
+                    
+                    # All samples coincide with a center when the total is zero
+                    if cumulative[-1] > 0:
+                        index = np.searchsorted(cumulative, random_state.uniform() * cumulative[-1], side='right')
+                        new_center = X[min(index, len(X) - 1)]
+                        
+                    else:
+                        new_center = X[random_state.randint(len(X))]
+                        
+                    new_centers.append(new_center)
+                    distances = np.minimum(distances, np.sum((X - new_center) ** 2, axis=1))
+                    
+                init = np.vstack([centers] + new_centers).astype(X.dtype)
+                
+            inits = [init] if isinstance(init, str) else [init, 'k-means++']
+            best = None
+            
+            for init in inits:
+                kmeans = KMeansClustering(
+                    n_clusters=k,
+                    max_iter=self.max_iter,
+                    random_state=self.random_state,
+                    n_init=ELBOW_N_INIT,
+                    backend=self.backend,
+                    init=init,
+                    use_minibatch=self.use_minibatch,
+                    tol=ELBOW_TOL
+                )
+                kmeans.fit(X, x_squared_norms=x_squared_norms)
+                
+                if best is None or kmeans.inertia_ < best.inertia_:
+                    best = kmeans
+                    
+            centers = best.cluster_centers_
+            inertia_values.append(best.inertia_)
             
-        return k_range, inertia_values
\ No newline at end of file
+        return inertia_values
@@ -2,17 +2,60 @@
 Module for loading data from various sources.
 """
 
+import os
+import logging
+import functools
 import pandas as pd
 import numpy as np
-from typing import Optional, Union, List, Tuple
+from typing import Optional, Union, List, Tuple, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+# Number of rows parsed per chunk by the streaming loaders
+DEFAULT_CHUNKSIZE = 200_000
+
+# Number of rows allocated for sheets that do not report their dimensions
+EXCEL_INITIAL_ROWS = 1024
+
+# Size in bytes above which .npy files are memory-mapped instead of read
+MMAP_MIN_BYTES = 100 * 1024 * 1024
+
+def _log_load_errors(loader: Callable) -> Callable:
+    """
+    Log errors raised by a loader together with the file path and re-raise them.
+    
+    Args:
+        loader: Loader function taking the file path as its first argument
+        
+    Returns:
+        Wrapped loader
+    """
+    
+    @functools.wraps(loader)
+    def wrapper(file_path, *args, **kwargs):
+        
+        try:
+            return loader(file_path, *args, **kwargs)
+        
+        except Exception as e:
+            logger.error("Error loading file %s: %s", file_path, e)
+            raise
+        
+    return wrapper
 
 class DataLoader:
     
     @staticmethod
+    @_log_load_errors
     def load_csv(file_path: str, **kwargs) -> pd.DataFrame:
         """
         Load data from a CSV file.
         
+        Without extra arguments the file is parsed with the multithreaded
+        pyarrow reader if it is installed, falling back to the C parser of
+        pandas, which reads the memory-mapped file in one pass so column
+        types are inferred once instead of per internal chunk.
+        
         Args:
             file_path: Path to the CSV file
             **kwargs: Additional arguments for pd.read_csv
@@ -21,18 +64,42 @@ class DataLoader:
             DataFrame with loaded data
         """
         
-        try:
-            return pd.read_csv(file_path, **kwargs)
+        if not kwargs:
+            
+            try:
+                import pyarrow as pa
+                import pyarrow.csv as pac
+                
+            except ImportError:
+                logger.debug("pyarrow is not installed, parsing %s with pandas", file_path)
+                
+            else:
+                
+                try:
+                    table = pac.read_csv(
+                        file_path,
+                        read_options=pac.ReadOptions(block_size=64 << 20, use_threads=True)
+                    )
+                    return table.to_pandas(self_destruct=True)
+                
+                except pa.ArrowInvalid as e:
+                    logger.debug("pyarrow could not parse %s, falling back to pandas: %s", file_path, e)
+                
+            kwargs = {'engine': 'c', 'memory_map': True, 'low_memory': False}
         
-        except Exception as e:
-            print(f"Error loading file {file_path}: {e}")
-            raise
+        return pd.read_csv(file_path, **kwargs)
     
     @staticmethod
+    @_log_load_errors
     def load_excel(file_path: str, **kwargs) -> pd.DataFrame:
         """
         Load data from an Excel file.
         
+        Without extra arguments the active sheet of an .xlsx file is
+        streamed with openpyxl in read-only mode, which skips building the
+        style and formula graph of the workbook; legacy .xls files are
+        read with pandas.
+        
         Args:
             file_path: Path to the Excel file
             **kwargs: Additional arguments for pd.read_excel
@@ -40,29 +107,244 @@ class DataLoader:
         Returns:
             DataFrame with loaded data
         """
+        
+        if not kwargs and os.path.splitext(file_path)[1].lower() in ('.xlsx', '.xlsm'):
+            from openpyxl import load_workbook
+            
+            workbook = load_workbook(file_path, read_only=True, data_only=True)
+            
+            try:
+                rows = list(workbook.active.iter_rows(values_only=True))
+                
+            finally:
+                workbook.close()
+                
+            if not rows:
+                return pd.DataFrame()
+                
+            # Read-only sheets may report empty trailing rows
+            while len(rows) > 1 and all(value is None for value in rows[-1]):
+                rows.pop()
+                
+            return pd.DataFrame(rows[1:], columns=DataLoader._sheet_columns(rows[0]))
+
+        return pd.read_excel(file_path, **kwargs)
+    
+    @staticmethod
+    def _sheet_columns(header: tuple) -> List[str]:
+        """
+        Get column names from the header row of a sheet.
+        
+        Args:
+            header: Values of the first row of the sheet
+            
+        Returns:
+            Column names, with pandas-style names for empty header cells
+        """
+        return [f"Unnamed: {i}" if name is None else str(name) for i, name in enumerate(header)]
+    
+    @staticmethod
+    def count_rows(file_path: str) -> int:
+        """
+        Count data rows in a text file (the header line is excluded).
+        
+        Args:
+            file_path: Path to the text file
+            
+        Returns:
+            Upper bound for the number of data rows
+        """
+        with open(file_path, 'rb', buffering=4 * 1024 * 1024) as f:
+            n_lines = sum(1 for _ in f)
+            
+        return max(n_lines - 1, 0)
+    
+    @staticmethod
+    @_log_load_errors
+    def load_csv_chunked(file_path: str,
+                         chunksize: int = DEFAULT_CHUNKSIZE,
+                         dtype: type = np.float32,
+                         progress_callback: Optional[Callable[[int], None]] = None) -> Tuple[np.ndarray, List[str]]:
+        """
+        Stream a numeric CSV file into a preallocated NumPy array.
+        
+        Only one chunk is held in memory at a time, so peak memory stays
+        close to the size of the resulting array. Chunks are parsed by the
+        multithreaded pyarrow reader if it is installed, otherwise by pandas.
+        
+        Args:
+            file_path: Path to the CSV file
+            chunksize: Number of rows parsed per chunk
+            dtype: Data type of the resulting array
+            progress_callback: Optional callable receiving progress in percent
+            
+        Returns:
+            Tuple of the data array and the list of column names
+        """
 
+        n_rows = DataLoader.count_rows(file_path)
+        data = None
+        columns = None
+        offset = 0
+        
+        for chunk_columns, chunk in DataLoader._iter_csv_chunks(file_path, chunksize, dtype):
+            
+            # Allocate the buffer once the number of columns is known
+            if data is None:
+                columns = chunk_columns
+                data = np.empty((n_rows, len(columns)), dtype=dtype)
+                
+            data[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+            
+            if progress_callback is not None and n_rows:
+                progress_callback(min(100, offset * 100 // n_rows))
+                
+        if data is None:
+            columns = pd.read_csv(file_path, nrows=0).columns.tolist()
+            data = np.empty((0, len(columns)), dtype=dtype)
+            
+        # Blank lines are counted but not parsed
+        return data[:offset], columns
+    
+    @staticmethod
+    def _iter_csv_chunks(file_path: str, chunksize: int, dtype: type) -> Iterator[Tuple[List[str], np.ndarray]]:
+        """
+        Parse a numeric CSV file into consecutive arrays of rows.
+        
+        Args:
+            file_path: Path to the CSV file
+            chunksize: Approximate number of rows per chunk
+            dtype: Data type of the chunks
+            
+        Yields:
+            Tuples of the column names and a chunk of rows
+            
+        Raises:
+            ValueError: If a column is not numeric
+        """
+        
         try:
-            return pd.read_excel(file_path, **kwargs)
+            import pyarrow as pa
+            import pyarrow.csv as pac
+            
+        except ImportError:
+            
+            for chunk in pd.read_csv(file_path, chunksize=chunksize, dtype=dtype, engine='c'):
+                yield chunk.columns.tolist(), chunk.to_numpy(copy=False)
+                
+            return
         
-        except Exception as e:
-            print(f"Error loading file {file_path}: {e}")
-            raise
+        # Columns are typed from the first block; values that do not fit the
+        # inferred type raise ArrowInvalid, a subclass of ValueError
+        reader = pac.open_csv(file_path, read_options=pac.ReadOptions(block_size=32 << 20, use_threads=True))
+        
+        try:
+            columns = reader.schema.names
+            
+            for field in reader.schema:
+                
+                if not (pa.types.is_integer(field.type) or pa.types.is_floating(field.type) or pa.types.is_null(field.type)):
+                    raise ValueError(f"Column {field.name} is not numeric")
+                    
+            for batch in reader:
+                chunk = np.empty((batch.num_rows, len(columns)), dtype=dtype)
+                
+                # Missing values of integer and empty columns become NaN
+                for j, column in enumerate(batch.columns):
+                    chunk[:, j] = column.to_numpy(zero_copy_only=False) if column.null_count < len(column) else np.nan
+                    
+                yield columns, chunk
+                
+        finally:
+            reader.close()
     
     @staticmethod
+    @_log_load_errors
+    def load_excel_chunked(file_path: str,
+                           chunksize: int = DEFAULT_CHUNKSIZE,
+                           dtype: type = np.float32,
+                           progress_callback: Optional[Callable[[int], None]] = None) -> Tuple[np.ndarray, List[str]]:
+        """
+        Stream the active sheet of an .xlsx file into a NumPy array.
+        
+        The workbook is opened in read-only mode, so rows are parsed lazily
+        without building the full cell graph in memory.
+        
+        Args:
+            file_path: Path to the Excel file
+            chunksize: Number of rows between progress reports
+            dtype: Data type of the resulting array
+            progress_callback: Optional callable receiving progress in percent
+            
+        Returns:
+            Tuple of the data array and the list of column names
+        """
+        from openpyxl import load_workbook
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        
+        try:
+            sheet = workbook.active
+            rows = sheet.iter_rows(values_only=True)
+            header = next(rows, None)
+            
+            if header is None:
+                return np.empty((0, 0), dtype=dtype), []
+                
+            columns = DataLoader._sheet_columns(header)
+            
+            # Sheet dimensions are only a hint in read-only mode; the buffer
+            # is sized from them and doubled if the sheet has more rows
+            n_rows = max((sheet.max_row or 1) - 1, 0)
+            data = np.empty((n_rows or EXCEL_INITIAL_ROWS, len(columns)), dtype=dtype)
+            offset = 0
+            n_filled = 0
+            
+            for row in rows:
+                
+                if offset == len(data):
+                    data = np.concatenate([data, np.empty_like(data)])
+                    
+                # Empty cells are read as None and converted to NaN
+                values = row[:len(columns)]
+                data[offset] = values
+                offset += 1
+                
+                # Read-only sheets may report empty trailing rows, which
+                # would otherwise become all-NaN samples
+                if any(value is not None for value in values):
+                    n_filled = offset
+                
+                if progress_callback is not None and n_rows and offset % chunksize == 0:
+                    progress_callback(min(100, offset * 100 // n_rows))
+                    
+        finally:
+            workbook.close()
+            
+        if progress_callback is not None:
+            progress_callback(100)
+            
+        # A view of a mostly unused buffer would keep all of it alive
+        if n_filled < len(data) // 2:
+            return data[:n_filled].copy(), columns
+            
+        return data[:n_filled], columns
+    
+    @staticmethod
+    @_log_load_errors
     def load_numpy(file_path: str) -> np.ndarray:
         """
         Load data from a NumPy file.
         
+        Files larger than MMAP_MIN_BYTES are memory-mapped read-only,
+        so pages are read on demand instead of all at once.
+        
         Args:
             file_path: Path to the .npy file
             
         Returns:
             NumPy array with loaded data
         """
-
-        try:
-            return np.load(file_path)
-        
-        except Exception as e:
-            print(f"Error loading file {file_path}: {e}")
-            raise
\ No newline at end of file
+        mmap_mode = 'r' if os.path.getsize(file_path) > MMAP_MIN_BYTES else None
+        return np.load(file_path, mmap_mode=mmap_mode)
@@ -20,34 +20,38 @@ class DataPreprocessor:
     def scale_data(self, 
                   data: Union[pd.DataFrame, np.ndarray], 
                   method: str = 'standard',
-                  feature_range: Tuple[int, int] = (0, 1)) -> np.ndarray:
+                  feature_range: Tuple[int, int] = (0, 1),
+                  copy: bool = True) -> np.ndarray:
         """
         Scale data using the selected method.
         
+        The floating point type of the input (float32 or float64) is preserved.
+        
         Args:
             data: Input data for scaling
             method: Scaling method ('standard', 'minmax', 'robust')
             feature_range: Range for MinMaxScaler
+            copy: If False, scale a floating point array in place
             
         Returns:
             Scaled data
         """
         
         if method == 'standard':
-            self.scaler = StandardScaler()
+            self.scaler = StandardScaler(copy=copy)
 
         elif method == 'minmax':
-            self.scaler = MinMaxScaler(feature_range=feature_range)
+            self.scaler = MinMaxScaler(feature_range=feature_range, copy=copy)
 
         elif method == 'robust':
-            self.scaler = RobustScaler()
+            self.scaler = RobustScaler(copy=copy)
 
         else:
             raise ValueError(f"Unknown scaling method: {method}")
         
         # Convert DataFrame to numpy array if necessary
         if isinstance(data, pd.DataFrame):
-            data = data.values
+            data = data.to_numpy(copy=False)
             
         return self.scaler.fit_transform(data)
     
@@ -68,7 +72,7 @@ class DataPreprocessor:
         
         # Convert DataFrame to numpy array if necessary
         if isinstance(data, pd.DataFrame):
-            data = data.values
+            data = data.to_numpy(copy=False)
             
         return self.imputer.fit_transform(data)
     
@@ -78,6 +82,9 @@ class DataPreprocessor:
         """
         Reduce data dimensionality using PCA.
         
+        When fewer components than features are kept, randomized SVD is
+        used, which only computes the leading components.
+        
         Args:
             data: High-dimensional input data
             n_components: Number of components to keep
@@ -85,12 +92,17 @@ class DataPreprocessor:
         Returns:
             Reduced dimensionality data
         """
-        self.pca = PCA(n_components=n_components)
-        
         # Convert DataFrame to numpy array if necessary
         if isinstance(data, pd.DataFrame):
-            data = data.values
+            data = data.to_numpy(copy=False)
             
+        self.pca = PCA(
+            n_components=n_components,
+            svd_solver='randomized' if n_components < min(data.shape) else 'auto',
+            n_oversamples=5,
+            random_state=0
+        )
+        
         return self.pca.fit_transform(data)
     
     def preprocess_pipeline(self, 
@@ -100,7 +112,8 @@ class DataPreprocessor:
                            handle_missing: bool = True,
                            missing_strategy: str = 'mean',
                            reduce_dims: bool = False,
-                           n_components: int = 2) -> np.ndarray:
+                           n_components: int = 2,
+                           dtype: type = np.float32) -> np.ndarray:
         """
         Complete data preprocessing pipeline.
         
@@ -112,17 +125,25 @@ class DataPreprocessor:
             missing_strategy: Missing value handling strategy
             reduce_dims: Flag to reduce dimensionality
             n_components: Number of components for dimensionality reduction
+            dtype: Floating point type the data is converted to; all later
+                stages preserve it, and float32 halves the memory traffic
+                of clustering and distance computations
             
         Returns:
             Preprocessed data
         """
-        processed_data = data.copy() if isinstance(data, pd.DataFrame) else data.copy()
+        
+        # Returns the caller's array itself if it already has the type
+        processed_data = np.asarray(data, dtype=dtype)
         
         if handle_missing:
             processed_data = self.handle_missing_values(processed_data, strategy=missing_strategy)
             
         if scale:
-            processed_data = self.scale_data(processed_data, method=scaling_method)
+
+            # The imputer returns a new array, which can be scaled in place;
+            # the caller's data is only copied if it would be scaled directly
+            processed_data = self.scale_data(processed_data, method=scaling_method, copy=not handle_missing)
             
         if reduce_dims:
             processed_data = self.reduce_dimensions(processed_data, n_components=n_components)
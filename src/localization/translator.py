@@ -4,8 +4,11 @@ Translator module for managing application translations.
 
 import os
 import json
+import logging
 from typing import Dict, Optional
 
+logger = logging.getLogger(__name__)
+
 # Path to the translations directory
 TRANSLATIONS_DIR = os.path.join(os.path.dirname(__file__), 'translations')
 
@@ -21,84 +24,74 @@ class Translator:
     
     _instance = None
     
-    def __new__(cls, language: str = 'en'):
+    # Translations of every available language, loaded once: {language: {key: text}}
+    _all_translations: Dict[str, dict] = {}
+    
+    def __new__(cls, language: Optional[str] = None):
         """
         Singleton pattern to ensure only one Translator instance exists.
         
         Args:
-            language: Language code ('en' or 'ru')
+            language: Language code ('en' or 'ru'); the existing instance
+                is switched to it if given, a new one defaults to 'en'
             
         Returns:
             Translator instance
         """
         if cls._instance is None:
+            cls._load_all_translations()
             cls._instance = super(Translator, cls).__new__(cls)
-            cls._instance.language = language
+            cls._instance.available_languages = list(cls._all_translations)
+            cls._instance.language = None
             cls._instance.translations = {}
-            cls._instance.available_languages = cls._get_available_languages()
-            cls._instance._load_translations()
+            cls._instance.set_language(language if language is not None else 'en')
+            
+        elif language is not None:
+            cls._instance.set_language(language)
         
         return cls._instance
     
-    @staticmethod
-    def _get_available_languages() -> list:
-        """
-        Get the list of available languages from the translations directory.
-        
-        Returns:
-            List of available language codes
+    @classmethod
+    def _load_all_translations(cls) -> None:
         """
-        available_languages = []
+        Load the translation files of all languages from the translations directory.
         
-        if not os.path.exists(TRANSLATIONS_DIR):
-            return ['en']  # Default to English if no translations directory
-            
-        for filename in os.listdir(TRANSLATIONS_DIR):
-            if filename.endswith('.json'):
-                lang_code = filename.split('.')[0]
-                available_languages.append(lang_code)
-                
-        return available_languages if available_languages else ['en']
-    
-    def _load_translations(self) -> None:
-        """
-        Load translations for the current language from a JSON file.
-        If the language file doesn't exist, fall back to English.
+        Translation files are small, so they are all read at startup and
+        switching languages never touches the disk. Files that cannot be
+        parsed leave their language with an empty dictionary.
         """
-        # Default to empty dictionary
-        self.translations = {}
+        cls._all_translations = {}
         
-        # Define the file path for the current language
-        lang_file = os.path.join(TRANSLATIONS_DIR, f"{self.language}.json")
-        
-        # If the language file doesn't exist, try to fall back to English
-        if not os.path.exists(lang_file) and self.language != 'en':
-            self.language = 'en'
-            lang_file = os.path.join(TRANSLATIONS_DIR, "en.json")
+        if os.path.exists(TRANSLATIONS_DIR):
             
-        # Load translations from the file
-        try:
-            with open(lang_file, 'r', encoding='utf-8') as f:
-                self.translations = json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError) as e:
-            print(f"Error loading translations: {str(e)}")
-            # Initialize with empty dictionary if loading fails
-            self.translations = {}
+            for filename in sorted(os.listdir(TRANSLATIONS_DIR)):
+                if filename.endswith('.json'):
+                    lang_code = filename.split('.')[0]
+                    
+                    try:
+                        with open(os.path.join(TRANSLATIONS_DIR, filename), 'r', encoding='utf-8') as f:
+                            cls._all_translations[lang_code] = json.load(f)
+                    except (OSError, json.JSONDecodeError) as e:
+                        logger.warning("Error loading translations: %s", e)
+                        cls._all_translations[lang_code] = {}
+                        
+        # Default to English if no translations are available
+        if not cls._all_translations:
+            cls._all_translations['en'] = {}
         
     def set_language(self, language: str) -> None:
         """
-        Set the current language and reload translations.
+        Set the current language.
         
         Args:
             language: Language code ('en', 'ru', etc.)
         """
         if language not in self.available_languages:
-            print(f"Warning: Unsupported language: {language}. Using English instead.")
+            logger.warning("Unsupported language: %s. Using English instead.", language)
             language = 'en'
             
-        if language != self.language:
-            self.language = language
-            self._load_translations()
+        self.language = language
+        self.translations = self._all_translations.get(language, {})
     
     def translate(self, key: str) -> str:
         """
@@ -116,13 +109,16 @@ class Translator:
         """
         Call method to use the translator as a function.
         
+        Looks the key up directly rather than through translate(),
+        as most UI code calls the translator this way.
+        
         Args:
             key: Translation key
             
         Returns:
             Translated string
         """
-        return self.translate(key)
+        return self.translations.get(key, key)
 
 
 # Global translator instance
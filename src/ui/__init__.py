@@ -4,16 +4,56 @@ User Interface Module.
 Provides the user interface components for application.
 """
 
-# Import all UI components
-from PyQt5.QtWidgets import QApplication
-from .app import ClusteringApp
-from .data_loader import load_data_from_file
-from ._perform_clustering import perform_clustering, update_data_info, preprocess_data
-from ._find_optimal_k import find_optimal_k
-from .results_visualizer import visualize_results, update_cluster_visualization, update_tabs_visualization
-from .data_saver import save_results
-from ._init_ui import init_ui, _create_menu_bar, _show_about_dialog, MatplotlibCanvas
-from ._update_visualization_language import update_visualization_language
+import sys
+import importlib
+
+# Submodules are imported on first attribute access (PEP 562), so importing
+# the package does not pull in Qt widgets, matplotlib and scikit-learn
+_LAZY = {
+    'QApplication': 'PyQt5.QtWidgets',
+    'ClusteringApp': '.app',
+    'LazyClass': '._lazy',
+    'load_data_from_file': '.data_loader',
+    'perform_clustering': '._perform_clustering',
+    'update_data_info': '._perform_clustering',
+    'preprocess_data': '._perform_clustering',
+    'find_optimal_k': '._find_optimal_k',
+    'visualize_results': '.results_visualizer',
+    'update_cluster_visualization': '.results_visualizer',
+    'update_tabs_visualization': '.results_visualizer',
+    'save_results': '.data_saver',
+    'init_ui': '._init_ui',
+    '_create_menu_bar': '._init_ui',
+    '_show_about_dialog': '._init_ui',
+    'MatplotlibCanvas': '._init_ui',
+    'update_visualization_language': '._update_visualization_language'
+}
+
+def __getattr__(name):
+    """
+    Import the submodule defining a lazily exported name.
+    
+    The value is stored in the module namespace, so each name
+    is imported only once.
+    
+    Args:
+        name: Name of the attribute
+        
+    Returns:
+        The attribute from its submodule
+    """
+    
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
 def create_app(
     data_loader_class, 
@@ -51,29 +91,36 @@ def create_app(
         change_language,
     )
     
-    # Create a dictionary of UI components that will be attached to the app
+    # Create a dictionary of UI components that will be attached to the app;
+    # looking them up on the package triggers their lazy import
+    package = sys.modules[__name__]
     ui_components = {
-        'MatplotlibCanvas': MatplotlibCanvas,
-        'init_ui': init_ui,
-        '_create_menu_bar': _create_menu_bar,
-        '_show_about_dialog': _show_about_dialog,
+        name: getattr(package, name)
+        for name in (
+            'MatplotlibCanvas',
+            'init_ui',
+            '_create_menu_bar',
+            '_show_about_dialog',
+            'update_visualization_language',
+            'perform_clustering',
+            'update_data_info',
+            'preprocess_data',
+            'find_optimal_k',
+            'load_data_from_file',
+            'save_results',
+            'visualize_results'
+        )
+    }
+    ui_components.update({
         'update_ui_elements_language': update_ui_elements_language,
         'update_ui_language': update_ui_language,
         'update_menu_language': update_menu_language,
         'update_tab_language': update_tab_language,
-        'change_language': change_language,
-        'update_visualization_language': update_visualization_language,
-        'perform_clustering': perform_clustering,
-        'update_data_info': update_data_info,
-        'preprocess_data': preprocess_data,
-        'find_optimal_k': find_optimal_k,
-        'load_data_from_file': load_data_from_file,
-        'save_results': save_results,
-        'visualize_results': visualize_results
-    }
+        'change_language': change_language
+    })
     
     # Initialize and return application instance
-    app = ClusteringApp(
+    app = package.ClusteringApp(
         data_loader_class,
         preprocessor_class,
         clustering_class,
@@ -89,6 +136,7 @@ def create_app(
 __all__ = [
     'create_app',
     'ClusteringApp',
+    'LazyClass',
     'load_data_from_file',
     'save_results',
     'visualize_results'
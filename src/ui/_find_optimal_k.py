@@ -5,7 +5,12 @@ Provides functionality to determine the optimal K parameter
 for K-means clustering using the Elbow method.
 """
 
+import numpy as np
 from PyQt5.QtWidgets import QMessageBox
+from ._workers import Worker, start_worker, show_worker_error
+
+# K values tested by the elbow method
+DEFAULT_K_RANGE = tuple(range(1, 11))
 
 def find_optimal_k(self):
     """
@@ -20,14 +25,15 @@ def find_optimal_k(self):
         self: The parent application instance containing:
             - processed_data: The preprocessed dataset ready for clustering
             - clustering_class: The K-means implementation to use
-            - visualizer: Component for creating visualizations
+            - backend_combo: UI element selecting the implementation of the algorithm
             - translator: Localization component for UI text
             - elbow_canvas: Canvas for displaying the elbow method plot
             - tabs: Tab widget to switch to the visualization
             - results_text: Text widget to display numerical results
     
     Returns:
-        None: Results are displayed in the UI rather than returned.
+        None: The sweep runs in the background; results are displayed
+            in the UI rather than returned.
     
     Raises:
         Exception: If any error occurs during the clustering process or visualization,
@@ -40,37 +46,104 @@ def find_optimal_k(self):
         QMessageBox.warning(self, tr('msg_warning'), tr('msg_no_processed_data'))
         return
         
-    try:
+    # A sweep is already running; its results will be shown when it finishes
+    if self._elbow_running:
+        self.statusBar().showMessage(f"{tr('msg_finding_optimal_k')}...")
+        return
+        
+    # The elbow curve only needs approximate inertia, so the sweep runs on a
+    # contiguous float32 copy made once per preprocessing result; distances
+    # are still summed in float64 by the k-means kernels
+    if self._processed_data_f32 is None:
+        self._processed_data_f32 = np.ascontiguousarray(self.processed_data, dtype=np.float32)
+        
+    # Repeated requests on the same data reuse the results of the first sweep
+    k_range = DEFAULT_K_RANGE
+    backend = self.backend_combo.currentText()
+    data = self._processed_data_f32
+    key = (self._data_generation, k_range, backend)
+    
+    if key in self._elbow_cache:
+        _on_elbow_done(self, *self._elbow_cache[key])
+        return
+        
+    # Run the elbow sweep on a pool thread to keep the UI responsive
+    worker = Worker(_run_elbow_method, self.clustering_class, data, k_range, backend)
+    worker.signals.finished.connect(lambda result: _on_elbow_computed(self, key, result))
+    worker.signals.failed.connect(lambda message: _on_elbow_failed(self, message))
+    
+    self._elbow_running = True
+    self.statusBar().showMessage(f"{tr('msg_finding_optimal_k')}...")
+    start_worker(self, worker)
 
-        # Create temporary model for finding optimal K
-        temp_kmeans = self.clustering_class()
+def _run_elbow_method(clustering_class, data, k_range, backend):
+    """
+    Compute inertia values for a range of K values.
+    
+    Runs on a worker thread and must not touch any widgets.
+    
+    Parameters:
+        clustering_class: The K-means implementation to use
+        data: The preprocessed dataset
+        k_range: K values to test
+        backend: Implementation of the algorithm selected in the UI
         
-        # Compute inertia values for a range of K values (1-10)
-        k_range, inertia_values = temp_kmeans.optimal_k_elbow(
-            self.processed_data,
-            k_range=list(range(1, 11))
-        )
+    Returns:
+        tuple: K values and corresponding inertia values
+    """
+    
+    # Create temporary model for finding optimal K with the backend used
+    # for clustering; each k is fitted independently from a k-means++
+    # seeding, as fits seeded from the previous k end in worse local optima
+    # that bend the curve; the fits run on threads, as the BLAS and Numba
+    # kernels release the GIL and worker processes would take seconds to
+    # start and import their dependencies
+    temp_kmeans = clustering_class(backend=backend)
+    return temp_kmeans.optimal_k_elbow(data, k_range=k_range, n_jobs=-1)
+
+def _on_elbow_computed(self, key, result):
+    """
+    Store the results of a finished sweep and display them.
+    
+    Parameters:
+        self: The parent application instance
+        key: Fingerprint of the data and K values the sweep ran on
+        result: Tuple of K values and corresponding inertia values
+    """
+    
+    # The data was replaced while the sweep was in progress
+    if key[0] != self._data_generation:
+        self._elbow_running = False
+        self.statusBar().clearMessage()
+        return
+        
+    self._elbow_cache[key] = result
+    _on_elbow_done(self, *result)
+
+def _on_elbow_done(self, k_range, inertia_values):
+    """
+    Plot the elbow method results and display them as text.
+    
+    Parameters:
+        self: The parent application instance
+        k_range: K values tested
+        inertia_values: Corresponding inertia values
+    """
+    tr = self.translator.translate
+    self._elbow_running = False
+    self.statusBar().clearMessage()
+    
+    try:
         
         # Visualize the elbow method results
-        fig = self.visualizer.plot_elbow_method(
-            k_range, 
-            inertia_values,
-            title=tr('plot_elbow_title'),
-            x_label=tr('plot_elbow_x'),
-            y_label=tr('plot_elbow_y')
-        )
-        self.elbow_canvas.figure = fig
-        self.elbow_canvas.draw()
+        _draw_elbow(self, k_range, inertia_values)
         
         # Switch to the elbow method tab to display results
         self.tabs.setCurrentIndex(1)
         
         # Create and format results text for detailed display
-        info_text = f"{tr('optimal_k_results')}\n\n"
-        info_text += f"{tr('metric_inertia')}:\n"
-        
-        for k, inertia in zip(k_range, inertia_values):
-            info_text += f"k = {k}: {inertia:.2f}\n"
+        lines = [f"k = {k}: {inertia:.2f}" for k, inertia in zip(k_range, inertia_values)]
+        info_text = f"{tr('optimal_k_results')}\n\n{tr('metric_inertia')}:\n" + "\n".join(lines) + "\n"
             
         # Display numerical results in the text field
         self.results_text.setText(info_text)
@@ -78,6 +151,62 @@ def find_optimal_k(self):
     except Exception as e:
         
         # Handle any errors and display them to the user
-        error_msg = f"{tr('msg_error')}: {str(e)}"
-        QMessageBox.critical(self, tr('msg_error'), error_msg)
-        self.results_text.setText(error_msg)
\ No newline at end of file
+        show_worker_error(self, str(e))
+
+def _draw_elbow(self, k_range, inertia_values):
+    """
+    Plot the elbow curve on the elbow canvas.
+    
+    The line of a previous sweep is updated in place when it is still
+    on the canvas, so repeated sweeps allocate no new figure.
+    
+    Parameters:
+        self: The parent application instance
+        k_range: K values tested
+        inertia_values: Corresponding inertia values
+    """
+    tr = self.translator.translate
+    canvas = self.elbow_canvas
+    figure = canvas.figure
+    ax = figure.axes[0] if figure.axes else figure.add_subplot(111)
+    
+    # Recreate the line if the axes were cleared or the figure replaced
+    if self._elbow_line is None or self._elbow_line not in ax.lines:
+        ax.clear()
+        self._elbow_line, = ax.plot(k_range, inertia_values, 'bo-')
+        ax.grid(True)
+        
+    else:
+        self._elbow_line.set_data(k_range, inertia_values)
+        
+        for annotation in self._elbow_annotations:
+            annotation.remove()
+            
+    # Add data points
+    self._elbow_annotations = [
+        ax.annotate(f'k={k}', xy=(k, inertia), xytext=(5, 0), textcoords='offset points', fontsize=10)
+        for k, inertia in zip(k_range, inertia_values)
+    ]
+    
+    # Configure plot
+    ax.set_title(tr('plot_elbow_title'), fontsize=15)
+    ax.set_xlabel(tr('plot_elbow_x'), fontsize=12)
+    ax.set_ylabel(tr('plot_elbow_y'), fontsize=12)
+    ax.set_xticks(k_range)
+    ax.relim()
+    ax.autoscale_view()
+    figure.tight_layout()
+    
+    canvas.draw_idle()
+
+def _on_elbow_failed(self, message):
+    """
+    Display an elbow method error to the user.
+    
+    Parameters:
+        self: The parent application instance
+        message: Error description
+    """
+    self._elbow_running = False
+    self.statusBar().clearMessage()
+    show_worker_error(self, message)
@@ -4,6 +4,7 @@ User Interface Initialization Module.
 Handles the creation of UI elements, layout design, and menu structure.
 """
 
+from functools import partial
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QPushButton, QLabel, QComboBox, QSpinBox,
@@ -15,6 +16,30 @@ from PyQt5.QtCore import Qt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 
+# Menu bar layout: (menu attribute and title key, [(action attribute,
+# text key, name of the slot method)]); the settings menu only holds the
+# language submenu, which is built from the available languages
+MENU_SPEC = (
+    ('menu_file', (
+        ('action_open', 'menu_open', 'load_data_from_file'),
+        ('action_exit', 'menu_exit', 'close')
+    )),
+    ('menu_data', (
+        ('action_preprocess', 'menu_preprocess', 'preprocess_data'),
+    )),
+    ('menu_analysis', (
+        ('action_perform_clustering', 'menu_perform_clustering', 'perform_clustering'),
+    )),
+    ('menu_results', (
+        ('action_save_results', 'menu_save_results', 'save_results'),
+        ('action_visualize', 'menu_visualize', 'visualize_results')
+    )),
+    ('menu_settings', ()),
+    ('menu_help', (
+        ('action_about', 'menu_about', '_show_about_dialog'),
+    ))
+)
+
 class MatplotlibCanvas(FigureCanvas):
     """
     Custom canvas class for embedding Matplotlib figures in PyQt applications.
@@ -76,6 +101,10 @@ def init_ui(self):
 
     # Get translator for localization
     tr = self.translator.translate
+    
+    # Suspend repaints while the widget tree is assembled, so adding each
+    # row and widget does not trigger an update of the window
+    self.setUpdatesEnabled(False)
 
     # Main window setup
     self.setWindowTitle(tr('app_title'))
@@ -107,8 +136,13 @@ def init_ui(self):
     self.load_data_btn = QPushButton(tr('menu_open'))
     self.load_data_btn.clicked.connect(self.load_data_from_file)
     
+    # Numeric precision of loaded data
+    self.float32_check = QCheckBox(tr('data_use_float32'))
+    self.float32_check.setChecked(True)
+    
     # Add widgets to data group
     data_layout.addWidget(self.load_data_btn)
+    data_layout.addWidget(self.float32_check)
     data_group.setLayout(data_layout)
     
     # Preprocessing settings group
@@ -175,6 +209,17 @@ def init_ui(self):
     self.max_iter_spin.setSingleStep(100)
     cluster_layout.addRow(tr('clustering_max_iter') + ":", self.max_iter_spin)
     
+    # Implementation of the clustering algorithm
+    self.backend_combo = QComboBox()
+    self.backend_combo.addItems(self.clustering_class.available_backends())
+    self.backend_combo.setCurrentText(self.clustering_class.preferred_backend())
+    cluster_layout.addRow(tr('clustering_backend') + ":", self.backend_combo)
+    
+    # Mini-batch updates for large datasets
+    self.minibatch_check = QCheckBox(tr('clustering_minibatch'))
+    self.minibatch_check.setChecked(True)
+    cluster_layout.addRow(self.minibatch_check)
+    
     # Clustering buttons
     self.cluster_btn = QPushButton(tr('clustering_button'))
     self.cluster_btn.clicked.connect(self.perform_clustering)
@@ -221,35 +266,25 @@ def init_ui(self):
     # Create tabs for different visualizations
     self.tabs = QTabWidget()
     
-    # Tab with cluster visualization
-    self.clusters_tab = QWidget()
-    clusters_layout = QVBoxLayout(self.clusters_tab)
-    self.clusters_canvas = MatplotlibCanvas(width=8, height=6)
-    clusters_layout.addWidget(self.clusters_canvas)
-    
-    # Tab with elbow method
-    self.elbow_tab = QWidget()
-    elbow_layout = QVBoxLayout(self.elbow_tab)
-    self.elbow_canvas = MatplotlibCanvas(width=8, height=6)
-    elbow_layout.addWidget(self.elbow_canvas)
-    
-    # Tab with silhouette coefficients
-    self.silhouette_tab = QWidget()
-    silhouette_layout = QVBoxLayout(self.silhouette_tab)
-    self.silhouette_canvas = MatplotlibCanvas(width=8, height=6)
-    silhouette_layout.addWidget(self.silhouette_canvas)
-    
-    # Tab with feature importance
-    self.features_tab = QWidget()
-    features_layout = QVBoxLayout(self.features_tab)
-    self.features_canvas = MatplotlibCanvas(width=8, height=6)
-    features_layout.addWidget(self.features_canvas)
-    
-    # Add tabs
-    self.tabs.addTab(self.clusters_tab, tr('plot_cluster'))
-    self.tabs.addTab(self.elbow_tab, tr('plot_elbow_title'))
-    self.tabs.addTab(self.silhouette_tab, tr('plot_silhouette_title'))
-    self.tabs.addTab(self.features_tab, tr('data_features'))
+    # Tabs for cluster visualization, elbow method, silhouette coefficients
+    # and feature importance; their canvases are created on first use
+    tab_specs = (
+        ('clusters', 'plot_cluster'),
+        ('elbow', 'plot_elbow_title'),
+        ('silhouette', 'plot_silhouette_title'),
+        ('features', 'data_features')
+    )
+    tab_names = [name for name, _ in tab_specs]
+    
+    for name, title_key in tab_specs:
+        tab = QWidget()
+        QVBoxLayout(tab)
+        setattr(self, f'{name}_tab', tab)
+        self.tabs.addTab(tab, tr(title_key))
+    
+    # Create the canvas of a tab when it is first shown
+    self.tabs.currentChanged.connect(lambda index: self._canvas(tab_names[index]))
+    self._canvas(tab_names[self.tabs.currentIndex()])
     
     # Add tabs to right panel
     right_layout.addWidget(self.tabs)
@@ -260,6 +295,9 @@ def init_ui(self):
     
     # Set initial splitter proportions (30% left, 70% right)
     splitter.setSizes([300, 700])
+    
+    # Resume repaints; the window is laid out once when it is shown
+    self.setUpdatesEnabled(True)
 
 def _create_menu_bar(self):
     """
@@ -287,50 +325,17 @@ def _create_menu_bar(self):
     # Create menu bar
     menubar = self.menuBar()
     
-    # File menu
-    self.menu_file = menubar.addMenu(tr('menu_file'))
-    
-    # Open action
-    self.action_open = QAction(tr('menu_open'), self)
-    self.action_open.triggered.connect(self.load_data_from_file)
-    self.menu_file.addAction(self.action_open)
-    
-    # Exit action
-    self.action_exit = QAction(tr('menu_exit'), self)
-    self.action_exit.triggered.connect(self.close)
-    self.menu_file.addAction(self.action_exit)
-    
-    # Data menu
-    self.menu_data = menubar.addMenu(tr('menu_data'))
-    
-    # Preprocess action
-    self.action_preprocess = QAction(tr('menu_preprocess'), self)
-    self.action_preprocess.triggered.connect(self.preprocess_data)
-    self.menu_data.addAction(self.action_preprocess)
-    
-    # Analysis menu
-    self.menu_analysis = menubar.addMenu(tr('menu_analysis'))
-    
-    # Perform clustering action
-    self.action_perform_clustering = QAction(tr('menu_perform_clustering'), self)
-    self.action_perform_clustering.triggered.connect(self.perform_clustering)
-    self.menu_analysis.addAction(self.action_perform_clustering)
-    
-    # Results menu
-    self.menu_results = menubar.addMenu(tr('menu_results'))
-    
-    # Save results action
-    self.action_save_results = QAction(tr('menu_save_results'), self)
-    self.action_save_results.triggered.connect(self.save_results)
-    self.menu_results.addAction(self.action_save_results)
-    
-    # Visualize action
-    self.action_visualize = QAction(tr('menu_visualize'), self)
-    self.action_visualize.triggered.connect(self.visualize_results)
-    self.menu_results.addAction(self.action_visualize)
-    
-    # Settings menu
-    self.menu_settings = menubar.addMenu(tr('menu_settings'))
+    # Menus and their actions; each menu and action is stored on the
+    # application under its attribute name
+    for menu_key, actions in MENU_SPEC:
+        menu = menubar.addMenu(tr(menu_key))
+        setattr(self, menu_key, menu)
+        
+        for action_name, text_key, slot_name in actions:
+            action = QAction(tr(text_key), self)
+            action.triggered.connect(getattr(self, slot_name))
+            menu.addAction(action)
+            setattr(self, action_name, action)
     
     # Language menu
     self.menu_language = self.menu_settings.addMenu(tr('menu_language'))
@@ -350,8 +355,8 @@ def _create_menu_bar(self):
         action.setCheckable(True)
         action.setChecked(self.current_language == lang)
         
-        # Use lambda with default argument to prevent closure issues
-        action.triggered.connect(lambda checked, l=lang: self.change_language(l))
+        # Bind the language with partial rather than a closure per action
+        action.triggered.connect(partial(_on_language_triggered, self, lang))
         
         # Add to action group and menu
         language_group.addAction(action)
@@ -359,14 +364,17 @@ def _create_menu_bar(self):
         
         # Store the action for later reference
         self.language_actions[lang] = action
+
+def _on_language_triggered(self, lang, checked=False):
+    """
+    Switch the application language from a language menu action.
     
-    # Help menu
-    self.menu_help = menubar.addMenu(tr('menu_help'))
-    
-    # About action
-    self.action_about = QAction(tr('menu_about'), self)
-    self.action_about.triggered.connect(self._show_about_dialog)
-    self.menu_help.addAction(self.action_about)
+    Parameters:
+        self: The parent application instance
+        lang: Language code of the triggered action
+        checked: Check state passed by the triggered signal (unused)
+    """
+    self.change_language(lang)
 
 def _show_about_dialog(self):
     """
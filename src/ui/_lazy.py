@@ -0,0 +1,61 @@
+"""
+Module for deferred imports.
+
+Provides a stand-in for classes whose modules are expensive to import,
+so that they are loaded only when first used instead of at startup.
+"""
+
+import importlib
+
+class LazyClass:
+    """
+    Proxy for a class that is imported on first use.
+
+    Calling the proxy creates an instance of the class, and attribute
+    access is forwarded to it, so the proxy can be passed wherever
+    the class itself is expected.
+
+    Parameters:
+        module_name (str): Absolute name of the module defining the class
+        class_name (str): Name of the class in that module
+    """
+
+    def __init__(self, module_name, class_name):
+        """
+        Initialize a new LazyClass instance.
+
+        Args:
+            module_name (str): Absolute name of the module defining the class
+            class_name (str): Name of the class in that module
+        """
+        self._module_name = module_name
+        self._class_name = class_name
+        self._cls = None
+
+    def resolve(self):
+        """
+        Import the module and return the class.
+
+        Returns:
+            type: The proxied class
+        """
+        if self._cls is None:
+            module = importlib.import_module(self._module_name)
+            self._cls = getattr(module, self._class_name)
+
+        return self._cls
+
+    def __call__(self, *args, **kwargs):
+        """
+        Create an instance of the proxied class.
+        """
+        return self.resolve()(*args, **kwargs)
+
+    def __getattr__(self, name):
+        """
+        Forward attribute access to the proxied class.
+        """
+        return getattr(self.resolve(), name)
+
+    def __repr__(self):
+        return f"LazyClass({self._module_name}.{self._class_name})"
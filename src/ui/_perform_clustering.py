@@ -5,8 +5,23 @@ Provides functionality for executing and evaluating clustering
 operations on preprocessed data.
 """
 
+import inspect
+import logging
 import numpy as np
 from PyQt5.QtWidgets import QMessageBox
+from ._workers import Worker, start_worker, show_worker_error
+
+logger = logging.getLogger(__name__)
+
+# Minimum number of samples for which mini-batch k-means is used when enabled
+MINIBATCH_MIN_SAMPLES = 5000
+
+# Number of samples above which silhouette values and feature importance
+# are computed on a random subset
+METRICS_MAX_SAMPLES = 5000
+
+# Number of clustering results kept for reruns with the same parameters
+CLUSTERING_CACHE_SIZE = 4
 
 def perform_clustering(self):
     """
@@ -20,16 +35,21 @@ def perform_clustering(self):
             - processed_data: The preprocessed dataset to cluster
             - n_clusters_spin: UI element for number of clusters selection
             - max_iter_spin: UI element for maximum iterations selection
+            - backend_combo: UI element for clustering implementation selection
+            - minibatch_check: UI element enabling mini-batch k-means for large datasets
             - clustering_class: The clustering algorithm class to use
+            - cluster_analyzer: Component computing silhouette values
             - translator: Translator object for UI messages
             - results_text: Text area to display results
             - tabs: Tab widget for switching visualization focus
             
     Returns:
-        None: Results are displayed in the UI and stored as instance attributes
+        None: Clustering runs in the background; once done, results are
+            displayed in the UI and stored as instance attributes
         
     Raises:
-        Exception: If clustering fails or evaluation encounters errors
+        Exception: If clustering fails or evaluation encounters errors,
+                  the error is displayed to the user
     """
     tr = self.translator
     
@@ -37,118 +57,281 @@ def perform_clustering(self):
         QMessageBox.warning(self, tr('msg_warning'), tr('msg_no_processed_data'))
         return
         
+    # Get clustering parameters
+    n_clusters = self.n_clusters_spin.value()
+    max_iter = self.max_iter_spin.value()
+    backend = self.backend_combo.currentText()
+    use_minibatch = self.minibatch_check.isChecked() and len(self.processed_data) > MINIBATCH_MIN_SAMPLES
+    
+    # Runs use a fixed random state, so a rerun with the same data and
+    # parameters reuses the previous result; the data is identified by its
+    # preprocessing generation, so results of a run that finishes after
+    # the data was replaced are never reused
+    key = (self._data_generation, n_clusters, max_iter, backend, use_minibatch)
+    
+    if key in self._clustering_cache:
+        _on_clustering_done(self, n_clusters, self._clustering_cache[key])
+        return
+    
+    # Run the computations on a pool thread to keep the UI responsive
+    worker = Worker(_run_clustering, self.clustering_class, self.cluster_analyzer, self.processed_data,
+                    n_clusters, max_iter, backend, use_minibatch)
+    worker.signals.finished.connect(lambda result: _on_clustering_computed(self, key, n_clusters, result))
+    worker.signals.failed.connect(lambda message: _on_clustering_failed(self, message))
+    
+    # The menu action would otherwise start a second run on the same data
+    self.cluster_btn.setEnabled(False)
+    self.action_perform_clustering.setEnabled(False)
+    start_worker(self, worker)
+
+def _run_clustering(clustering_class, cluster_analyzer, data, n_clusters, max_iter, backend, use_minibatch):
+    """
+    Fit the clustering model and compute all derived results.
+    
+    Runs on a worker thread and must not touch any widgets.
+    
+    Parameters:
+        clustering_class: The clustering algorithm class to use
+        cluster_analyzer: Component for analyzing clustering results
+        data: The preprocessed dataset to cluster
+        n_clusters: Number of clusters
+        max_iter: Maximum number of iterations
+        backend: Implementation of the clustering algorithm
+        use_minibatch: Use mini-batch k-means
+        
+    Returns:
+        dict: Fitted model, labels, evaluation metrics, elbow curve,
+            silhouette values and feature importance
+    """
+    result = {
+        'elbow_k_range': None,
+        'elbow_curve': None,
+        'silhouette_values': None,
+        'silhouette_labels': None,
+        'feature_importance': None
+    }
+    
+    # Create model
+    kmeans = clustering_class(
+        n_clusters=n_clusters,
+        max_iter=max_iter,
+        random_state=42,
+        backend=backend,
+        use_minibatch=use_minibatch and backend != 'faiss'
+    )
+    
+    # Perform clustering
+    labels = kmeans.fit_predict(data)
+    
+    result['kmeans'] = kmeans
+    result['labels'] = labels
+    
+    # Calculate elbow method curve
     try:
 
-        # Get clustering parameters
-        n_clusters = self.n_clusters_spin.value()
-        max_iter = self.max_iter_spin.value()
+        # Get range of k values (from 1 to n_clusters+5, but no more than 15)
+        k_max = min(n_clusters + 5, 15)
+        k_range = list(range(1, k_max))
         
-        # Create model
-        self.kmeans = self.clustering_class(
-            n_clusters=n_clusters,
-            max_iter=max_iter,
-            random_state=42
+        # Find optimal k with the backend used for clustering, so the curve
+        # matches the one of find_optimal_k; each k is fitted independently,
+        # as fits seeded from the previous k end in worse local optima
+        temp_kmeans = clustering_class(backend=backend)
+        result['elbow_k_range'], result['elbow_curve'] = temp_kmeans.optimal_k_elbow(
+            data,
+            k_range=k_range,
+            n_jobs=-1
         )
         
-        # Perform clustering
-        self.labels = self.kmeans.fit_predict(self.processed_data)
-        
-        # Evaluate results
-        evaluation = self.kmeans.evaluate(self.processed_data)
+    except Exception as e:
+        logger.warning("Error calculating elbow method: %s", e)
+
+    # Silhouette values cost O(n²) and mutual information a neighbor search
+    # per feature; both are summaries, so large datasets use a random subset
+    if len(data) > METRICS_MAX_SAMPLES:
+        sample = np.sort(np.random.default_rng(42).choice(len(data), METRICS_MAX_SAMPLES, replace=False))
+        metric_data, metric_labels = data[sample], labels[sample]
         
-        # Calculate and display elbow method plot
-        try:
+    else:
+        metric_data, metric_labels = data, labels
 
-            # Get range of k values (from 1 to n_clusters+5, but no more than 15)
-            k_max = min(n_clusters + 5, 15)
-            k_range = list(range(1, k_max))
-            
-            # Find optimal k and create plot
-            temp_kmeans = self.clustering_class()
-            k_range, inertia_values = temp_kmeans.optimal_k_elbow(
-                self.processed_data,
-                k_range=k_range
-            )
-            
-            # Save data for visualization
-            self.elbow_k_range = k_range
-            self.elbow_curve = inertia_values
-            
-        except Exception as e:
-            print(f"Error calculating elbow method: {str(e)}")
+    # Calculate silhouette coefficients if more than one cluster
+    if n_clusters > 1:
 
-        # Calculate silhouette coefficients if more than one cluster
-        if n_clusters > 1:
+        try:
+            result['silhouette_values'] = cluster_analyzer.get_silhouette_values(metric_data, metric_labels)
+            result['silhouette_labels'] = metric_labels
 
-            try:
-                from sklearn.metrics import silhouette_samples
-                self.silhouette_values = silhouette_samples(self.processed_data, self.labels)
+        except Exception as e:
+            logger.warning("Error calculating silhouette coefficients: %s", e)
+            
+    # Evaluate results; silhouette values of all samples give the exact
+    # silhouette score, so it is not computed a second time
+    exact_silhouette = result['silhouette_values'] if metric_data is data else None
+    result['evaluation'] = kmeans.evaluate(data, silhouette_values=exact_silhouette)
 
-            except Exception as e:
-                print(f"Error calculating silhouette coefficients: {str(e)}")
-                self.silhouette_values = None
+    # Calculate feature importance
+    try:
 
-        # Calculate feature importance (if data available)
-        try:
+        # Calculate mutual information between features and cluster labels
+        result['feature_importance'] = _mutual_information(metric_data, metric_labels)
 
-            if hasattr(self, 'processed_data') and self.processed_data is not None:
-
-                # Use built-in feature importance metric or variance
-                from sklearn.feature_selection import mutual_info_classif
-                
-                # Calculate mutual information between features and cluster labels
-                self.feature_importance = mutual_info_classif(
-                    self.processed_data, 
-                    self.labels,
-                    discrete_features=False,
-                    random_state=42
-                )
-                
-                # If we have original column names, save them
-                if hasattr(self, 'data') and hasattr(self.data, 'columns'):
-                    self.original_columns = self.data.columns.tolist()
-
-            else:
-                self.feature_importance = None
+    except Exception as e:
+        logger.warning("Error calculating feature importance: %s", e)
+        
+    return result
 
-        except Exception as e:
-            print(f"Error calculating feature importance: {str(e)}")
-            self.feature_importance = None
+def _mutual_information(data, labels):
+    """
+    Calculate the mutual information between each feature and the cluster labels.
+    
+    Features are processed in parallel: through the n_jobs argument of
+    mutual_info_classif where scikit-learn supports it (1.5 and later),
+    otherwise with one joblib thread per feature.
+    
+    Parameters:
+        data: The clustered dataset
+        labels: Cluster labels
+        
+    Returns:
+        numpy.ndarray: Mutual information of each feature
+    """
+    from joblib import Parallel, delayed
+    from sklearn.feature_selection import mutual_info_classif
+    
+    if 'n_jobs' in inspect.signature(mutual_info_classif).parameters:
+        return mutual_info_classif(data, labels, discrete_features=False, random_state=42, n_jobs=-1)
+        
+    # The estimate of each feature depends only on that feature
+    data = np.asarray(data)
+    values = Parallel(n_jobs=-1, prefer='threads')(
+        delayed(mutual_info_classif)(data[:, [j]], labels, discrete_features=False, random_state=42)
+        for j in range(data.shape[1])
+    )
+    return np.concatenate(values)
 
-        # Visualize results
-        self.visualize_results()
+def _on_clustering_computed(self, key, n_clusters, result):
+    """
+    Store the result of a finished run and display it.
+    
+    Parameters:
+        self: The parent application instance
+        key: Fingerprint of the data and parameters of the run
+        n_clusters: Number of clusters used for the run
+        result: Dictionary returned by _run_clustering
+    """
+    
+    # The data was replaced while the run was in progress, so its labels
+    # no longer belong to the processed data
+    if key[0] != self._data_generation:
+        logger.debug("Discarding clustering result of replaced data")
+        self.cluster_btn.setEnabled(True)
+        self.action_perform_clustering.setEnabled(True)
+        return
+    
+    # Drop the oldest result once the cache is full
+    if len(self._clustering_cache) >= CLUSTERING_CACHE_SIZE:
+        self._clustering_cache.pop(next(iter(self._clustering_cache)))
         
-        # Results information
-        info_text = f"{tr('clustering_results')}:\n\n"
-        info_text += f"{tr('clustering_k')}: {n_clusters}\n"
-        info_text += f"{tr('metric_inertia')}: {evaluation['inertia']:.4f}\n"
+    self._clustering_cache[key] = result
+    _on_clustering_done(self, n_clusters, result)
+
+def _on_clustering_done(self, n_clusters, result):
+    """
+    Store clustering results, visualize them and display metrics.
+    
+    Parameters:
+        self: The parent application instance
+        n_clusters: Number of clusters used for the run
+        result: Dictionary returned by _run_clustering
+    """
+    tr = self.translator
+    
+    self.cluster_btn.setEnabled(True)
+    self.action_perform_clustering.setEnabled(True)
+    
+    try:
+        self.kmeans = result['kmeans']
+        self.labels = result['labels']
+        self._results_df_cache = None
+        self.evaluation = result['evaluation']
         
-        if 'silhouette_score' in evaluation:
-            info_text += f"{tr('metric_silhouette')}: {evaluation['silhouette_score']:.4f}\n"
-            
-        if 'calinski_harabasz_score' in evaluation:
-            info_text += f"{tr('metric_calinski_harabasz')}: {evaluation['calinski_harabasz_score']:.4f}\n"
+        # Keep the previous elbow curve if it could not be recomputed
+        if result['elbow_curve'] is not None:
+            self.elbow_k_range = result['elbow_k_range']
+            self.elbow_curve = result['elbow_curve']
             
-        if 'davies_bouldin_score' in evaluation:
-            info_text += f"{tr('metric_davies_bouldin')}: {evaluation['davies_bouldin_score']:.4f}\n"
+        self.silhouette_values = result['silhouette_values']
+        self.silhouette_labels = result['silhouette_labels']
+        self.feature_importance = result['feature_importance']
         
-        # Add cluster size information
-        if self.labels is not None:
-            info_text += f"\n{tr('plot_cluster')}:\n"
-            unique_labels, counts = np.unique(self.labels, return_counts=True)
-            
-            for label, count in zip(unique_labels, counts):
-                info_text += f"{tr('plot_cluster')} {label}: {count} {tr('data_samples')}\n"
+        # If we have original column names, save them
+        if hasattr(self, 'data') and hasattr(self.data, 'columns'):
+            self.original_columns = self.data.columns.tolist()
+
+        # Visualize results
+        self.visualize_results()
         
         # Display results in the text field instead of message box
-        self.results_text.setText(info_text)
+        self.results_text.setText(format_clustering_results(tr, n_clusters, self.evaluation, self.labels))
         
         # Switch to the clusters tab to show visualization
         self.tabs.setCurrentIndex(0)
     
     except Exception as e:
-        QMessageBox.critical(self, tr('msg_error'), f"{tr('msg_error')}: {str(e)}")
-        self.results_text.setText(f"{tr('msg_error')}: {str(e)}")
+        show_worker_error(self, str(e))
+
+def format_clustering_results(tr, n_clusters, evaluation, labels):
+    """
+    Format the clustering metrics and cluster sizes for the results text.
+    
+    Parameters:
+        tr: Translation function
+        n_clusters: Number of clusters
+        evaluation: Dictionary of evaluation metrics
+        labels: Cluster labels (None to omit cluster sizes)
+        
+    Returns:
+        str: Results text
+    """
+    lines = [f"{tr('clustering_results')}:", "", f"{tr('clustering_k')}: {n_clusters}"]
+    
+    for key, metric in (
+        ('inertia', 'metric_inertia'),
+        ('silhouette_score', 'metric_silhouette'),
+        ('calinski_harabasz_score', 'metric_calinski_harabasz'),
+        ('davies_bouldin_score', 'metric_davies_bouldin')
+    ):
+        
+        if key in evaluation:
+            lines.append(f"{tr(metric)}: {evaluation[key]:.4f}")
+    
+    # Add cluster size information
+    if labels is not None:
+        lines += ["", f"{tr('plot_cluster')}:"]
+        
+        # K-means labels are small non-negative integers, so one counting
+        # pass replaces sorting; empty clusters are skipped
+        counts = np.bincount(labels)
+        unique_labels = np.flatnonzero(counts)
+        lines.extend(
+            f"{tr('plot_cluster')} {label}: {count} {tr('data_samples')}"
+            for label, count in zip(unique_labels, counts[unique_labels])
+        )
+        
+    return "\n".join(lines) + "\n"
+
+def _on_clustering_failed(self, message):
+    """
+    Re-enable the clustering controls and display the error.
+    
+    Parameters:
+        self: The parent application instance
+        message: Error description
+    """
+    self.cluster_btn.setEnabled(True)
+    self.action_perform_clustering.setEnabled(True)
+    show_worker_error(self, message)
 
 def update_data_info(self):
     """
@@ -186,16 +369,19 @@ def preprocess_data(self):
             - missing_check, missing_method_combo: UI elements for missing value handling
             - dim_reduce_check, dim_reduce_method_combo: UI elements for dimensionality reduction
             - n_components_spin: UI element for number of components selection
+            - float32_check: UI element selecting single precision for the data
             - preprocessor: Object with preprocessing methods
             - visualizer: Object with visualization methods including dimensionality reduction
             - translator: Translator object for UI messages
             - results_text: Text area to display results
             
     Returns:
-        None: Processed data is stored as instance attributes (processed_data, reduced_data)
+        None: Preprocessing runs in the background; once done, processed data
+            is stored as instance attributes (processed_data, reduced_data)
         
     Raises:
-        Exception: If preprocessing fails due to invalid data or parameters
+        Exception: If preprocessing fails due to invalid data or parameters,
+                  the error is displayed to the user
     """
     tr = self.translator
     
@@ -203,41 +389,147 @@ def preprocess_data(self):
         QMessageBox.warning(self, tr('msg_warning'), tr('msg_load_data_first'))
         return
         
-    try:
+    # Get preprocessing parameters
+    params = {
+        'scale': self.scale_check.isChecked(),
+        'scaling_method': self.scale_method_combo.currentText(),
+        'handle_missing': self.missing_check.isChecked(),
+        'missing_strategy': self.missing_method_combo.currentText(),
+        'reduce_dims': self.dim_reduce_check.isChecked(),
+        'n_components': self.n_components_spin.value(),
+        'dim_reduce_method': self.dim_reduce_method_combo.currentText(),
+        'dtype': np.float32 if self.float32_check.isChecked() else np.float64
+    }
+    
+    # Run preprocessing on a pool thread to keep the UI responsive
+    worker = Worker(_run_preprocessing, self.preprocessor, self.visualizer, self.data, **params)
+    generation = self._data_generation
+    worker.signals.finished.connect(lambda result: _on_preprocessing_done(self, generation, result))
+    worker.signals.failed.connect(lambda message: _on_preprocessing_failed(self, message))
+    
+    # The menu action would otherwise start a second run sharing the preprocessor
+    self.preprocess_btn.setEnabled(False)
+    self.action_preprocess.setEnabled(False)
+    start_worker(self, worker)
 
-        # Get preprocessing parameters
-        scale = self.scale_check.isChecked()
-        scaling_method = self.scale_method_combo.currentText()
-        handle_missing = self.missing_check.isChecked()
-        missing_strategy = self.missing_method_combo.currentText()
-        reduce_dims = self.dim_reduce_check.isChecked()
-        n_components = self.n_components_spin.value()
-        dim_reduce_method = self.dim_reduce_method_combo.currentText()
-        
-        # Preprocess data
-        self.processed_data = self.preprocessor.preprocess_pipeline(
-            self.data,
-            scale=scale,
-            scaling_method=scaling_method,
-            handle_missing=handle_missing,
-            missing_strategy=missing_strategy,
-            reduce_dims=False
-        )
+def _run_preprocessing(preprocessor, visualizer, data, scale, scaling_method, handle_missing,
+                       missing_strategy, reduce_dims, n_components, dim_reduce_method, dtype):
+    """
+    Preprocess data and reduce its dimensionality.
+    
+    Runs on a worker thread and must not touch any widgets.
+    
+    Parameters:
+        preprocessor: Object with preprocessing methods
+        visualizer: Object with dimensionality reduction methods
+        data: The original dataset to preprocess
+        scale, scaling_method: Scaling settings
+        handle_missing, missing_strategy: Missing value handling settings
+        reduce_dims, n_components, dim_reduce_method: Dimensionality reduction settings
+        dtype: Floating point type of the processed data
+        
+    Returns:
+        tuple: Processed data, reduced data, 2D projection for the cluster plot
+            and the PCA components and mean producing it (None for a t-SNE embedding)
+    """
+    from sklearn.decomposition import PCA
+    
+    # Preprocess data
+    processed_data = preprocessor.preprocess_pipeline(
+        data,
+        scale=scale,
+        scaling_method=scaling_method,
+        handle_missing=handle_missing,
+        missing_strategy=missing_strategy,
+        reduce_dims=False,
+        dtype=dtype
+    )
+    
+    # A PCA reduction also yields the 2D projection for the cluster plot
+    # (its first two components), so both come from a single fit on the
+    # processed data; keeping the projection matrix lets cluster centers
+    # be mapped into the same space
+    if reduce_dims and dim_reduce_method == 'pca':
+        n_fit_components = max(n_components, min(2, processed_data.shape[1]))
+        pca = PCA(
+            n_components=n_fit_components,
+            svd_solver='randomized' if n_fit_components < min(processed_data.shape) else 'auto',
+            n_oversamples=5,
+            random_state=42
+        ).fit(processed_data)
+        projected = pca.transform(processed_data)
+        reduced_data = projected[:, :n_components]
+        vis_data = projected[:, :2]
+        pca_components = pca.components_[:2].astype(np.float32)
+        pca_mean = pca.mean_.astype(np.float32)
+        
+    else:
         
         # Reduce dimensionality if needed
         if reduce_dims:
-            self.reduced_data = self.visualizer.reduce_dimensions(
-                self.processed_data,
+            reduced_data = visualizer.reduce_dimensions(
+                processed_data,
                 method=dim_reduce_method,
                 n_components=n_components
             )
             
         else:
-            self.reduced_data = self.processed_data
+            reduced_data = processed_data
+            
+        # Compute the 2D projection for the cluster plot once
+        if reduce_dims and reduced_data.shape[1] == 2:
+            vis_data = reduced_data
+            pca_components = pca_mean = None
+            
+        else:
+            n_vis_components = min(2, processed_data.shape[1])
+            pca = PCA(
+                n_components=n_vis_components,
+                svd_solver='randomized' if n_vis_components < min(processed_data.shape) else 'auto',
+                n_oversamples=5,
+                random_state=42
+            ).fit(processed_data)
+            vis_data = pca.transform(processed_data)
+            pca_components = pca.components_.astype(np.float32)
+            pca_mean = pca.mean_.astype(np.float32)
         
-        # Update results text    
-        self.results_text.setText(tr('msg_preprocessing_done'))
+    return processed_data, reduced_data, vis_data, pca_components, pca_mean
+
+def _on_preprocessing_done(self, generation, result):
+    """
+    Store preprocessed data and notify the user.
     
-    except Exception as e:
-        QMessageBox.critical(self, tr('msg_error'), f"{tr('msg_error')}: {str(e)}")
-        self.results_text.setText(f"{tr('msg_error')}: {str(e)}")
\ No newline at end of file
+    Parameters:
+        self: The parent application instance
+        generation: Data generation the preprocessing started from
+        result: Tuple returned by _run_preprocessing
+    """
+    self.preprocess_btn.setEnabled(True)
+    self.action_preprocess.setEnabled(True)
+    
+    # New data was loaded while preprocessing the previous one
+    if generation != self._data_generation:
+        logger.debug("Discarding preprocessing result of replaced data")
+        return
+        
+    self.processed_data, self.reduced_data, self._vis_2d, self._pca_components, self._pca_mean = result
+    self._results_df_cache = None
+    self._processed_data_f32 = None
+    self._data_generation += 1
+    self._elbow_cache = {}
+    self._clustering_cache = {}
+    
+    # Update results text    
+    self.results_text.setText(self.translator('msg_preprocessing_done'))
+
+def _on_preprocessing_failed(self, message):
+    """
+    Re-enable the preprocessing button and display the error.
+    
+    Parameters:
+        self: The parent application instance
+        message: Error description
+    """
+    self.preprocess_btn.setEnabled(True)
+    self.action_preprocess.setEnabled(True)
+    show_worker_error(self, message)
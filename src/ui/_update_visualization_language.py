@@ -5,7 +5,9 @@ Provides functionality for dynamically updating all visualization
 elements when the application language is changed.
 """
 
-import traceback
+import logging
+
+logger = logging.getLogger(__name__)
 
 def update_visualization_language(self):
     """
@@ -26,31 +28,16 @@ def update_visualization_language(self):
         None: Visualizations are updated in-place
     """
 
-    # Ensure all required data and canvases exist
-    required_attrs = ['reduced_data', 'labels', 'clusters_canvas']
-    if not all(hasattr(self, attr) for attr in required_attrs):
-        print("Skipping visualization update - missing required attributes")
-        return
-        
-    # Check if data is available and not empty
+    # Check if data is available and not empty; the attributes are
+    # initialized to None by ClusteringApp, so no existence probes are needed
     if self.reduced_data is None or self.labels is None:
-        print("Skipping visualization update - no data available")
+        logger.debug("Skipping visualization update - no data available")
         return
         
     if len(self.reduced_data) == 0 or len(self.labels) == 0:
-        print("Skipping visualization update - empty data")
+        logger.debug("Skipping visualization update - empty data")
         return
     
-    # Check if canvases are properly initialized
-    for canvas_name in ['clusters_canvas', 'elbow_canvas', 'silhouette_canvas', 'features_canvas']:
-        
-        if hasattr(self, canvas_name):
-            canvas = getattr(self, canvas_name)
-            
-            if not hasattr(canvas, 'axes') or canvas.axes is None:
-                print(f"Skipping visualization update - {canvas_name} is not properly initialized")
-                return
-    
     # Update all visualizations when language changes
     try:
 
@@ -61,62 +48,28 @@ def update_visualization_language(self):
             from .results_visualizer import update_cluster_visualization
             update_cluster_visualization(self)
 
-        except Exception as e:
-            print(f"Error updating cluster visualization: {str(e)}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error updating cluster visualization")
         
-        # Update elbow method plot if data is available
-        if hasattr(self, 'elbow_k_range') and hasattr(self, 'elbow_curve') and \
-           self.elbow_k_range is not None and self.elbow_curve is not None:
+        # Update elbow method plot; only its text depends on the language,
+        # so a plot on the canvas is relabeled in place
+        try:
+            tr = self.translator.translate
+            elbow_canvas = self._canvases.get('elbow')
             
-            try:
-                import matplotlib.pyplot as plt
-                
-                # Save reference to current figure and canvas
-                current_canvas = self.elbow_canvas
-                current_figure = current_canvas.figure
-                
-                # Create new figure with the same size
-                fig_size = current_figure.get_size_inches()
-                new_figure = plt.figure(figsize=fig_size)
-                
-                # Create new axes on the new figure
-                new_axes = new_figure.add_subplot(111)
-                
-                tr = self.translator.translate  # Use translate method instead of object
-                
-                # Plot elbow method on new axes
-                new_axes.plot(self.elbow_k_range, self.elbow_curve, 'bo-')
-                new_axes.set_xlabel(tr('plot_elbow_x'))
-                new_axes.set_ylabel(tr('plot_elbow_y'))
-                new_axes.set_title(tr('plot_elbow_title'))
-                
-                # Add labels to points
-                for k, inertia in zip(self.elbow_k_range, self.elbow_curve):
-                    new_axes.annotate(
-                        f'k={k}',
-                        xy=(k, inertia),
-                        xytext=(5, 0),
-                        textcoords='offset points',
-                        fontsize=10
-                    )
-                
-                # Set integer ticks on x-axis
-                new_axes.set_xticks(self.elbow_k_range)
-                
-                # Apply tight_layout for optimal space usage
-                new_figure.tight_layout()
-                
-                # Update canvas with new figure
-                current_canvas.figure = new_figure
-                current_canvas.draw()
+            if elbow_canvas is not None and elbow_canvas.axes.lines:
+                ax = elbow_canvas.axes
+                ax.title.set_text(tr('plot_elbow_title'))
+                ax.xaxis.label.set_text(tr('plot_elbow_x'))
+                ax.yaxis.label.set_text(tr('plot_elbow_y'))
+                elbow_canvas.draw_idle()
                 
-                # Close old figure to free resources
-                plt.close(current_figure)
+            elif self.elbow_k_range is not None and self.elbow_curve is not None:
+                from ._find_optimal_k import _draw_elbow
+                _draw_elbow(self, self.elbow_k_range, self.elbow_curve)
 
-            except Exception as e:
-                print(f"Error updating elbow plot: {str(e)}")
-                traceback.print_exc()
+        except Exception:
+            logger.exception("Error updating elbow plot")
         
         # Update other plots
         try:
@@ -125,10 +78,8 @@ def update_visualization_language(self):
             from .results_visualizer import update_tabs_visualization
             update_tabs_visualization(self)
 
-        except Exception as e:
-            print(f"Error updating visualization tabs: {str(e)}")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Error updating visualization tabs")
         
-    except Exception as e:
-        print(f"Error in visualization language update: {str(e)}")
-        traceback.print_exc()
\ No newline at end of file
+    except Exception:
+        logger.exception("Error in visualization language update")
\ No newline at end of file
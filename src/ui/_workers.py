@@ -0,0 +1,111 @@
+"""
+Module for background workers.
+
+Provides a generic QRunnable wrapper for running long operations
+on the global thread pool without blocking the Qt event loop.
+"""
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt5.QtWidgets import QMessageBox
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by a background worker.
+
+    Attributes:
+        finished: Emitted with the result of the worker function
+        failed: Emitted with the error message if the worker function raises
+        progress: Emitted with progress in percent
+    """
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+    progress = pyqtSignal(int)
+
+class Worker(QRunnable):
+    """
+    Runnable executing a function on a pool thread.
+
+    Results and errors are delivered through signals, so connected
+    slots are invoked on the GUI thread.
+
+    Parameters:
+        fn (callable): Function to execute
+        *args: Positional arguments for the function
+        report_progress (bool): Pass progress_callback to the function, default is False
+        **kwargs: Keyword arguments for the function
+    """
+
+    def __init__(self, fn, *args, report_progress=False, **kwargs):
+        """
+        Initialize a new Worker instance.
+
+        Args:
+            fn (callable): Function to execute
+            *args: Positional arguments for the function
+            report_progress (bool, optional): Pass the progress signal's emit method
+                to the function as progress_callback. Defaults to False.
+            **kwargs: Keyword arguments for the function
+        """
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+        if report_progress:
+            self.kwargs['progress_callback'] = self.signals.progress.emit
+
+    @pyqtSlot()
+    def run(self):
+        """Execute the function and emit its result or error."""
+
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+
+        else:
+            self.signals.finished.emit(result)
+
+def start_worker(owner, worker):
+    """
+    Start a worker on the global thread pool.
+
+    A reference to the worker is kept on the owner until the worker
+    reports back, so its signals are not garbage collected early.
+
+    Parameters:
+        owner: The parent application instance
+        worker: Worker to start
+
+    Returns:
+        Worker: The started worker
+    """
+
+    if not hasattr(owner, '_active_workers'):
+        owner._active_workers = set()
+
+    owner._active_workers.add(worker)
+    release = lambda *args: owner._active_workers.discard(worker)
+    worker.signals.finished.connect(release)
+    worker.signals.failed.connect(release)
+
+    QThreadPool.globalInstance().start(worker)
+    return worker
+
+def show_worker_error(owner, message):
+    """
+    Display an error reported by a worker to the user.
+
+    Parameters:
+        owner: The parent application instance containing:
+            - translator: For localizing the error title
+            - results_text: Text widget to display the error
+        message: Error description
+    """
+    tr = owner.translator.translate
+
+    error_msg = f"{tr('msg_error')}: {message}"
+    QMessageBox.critical(owner, tr('msg_error'), error_msg)
+    owner.results_text.setText(error_msg)
@@ -25,6 +25,25 @@ class ClusteringApp(QMainWindow):
         processed_data: Dataset after preprocessing
         labels: Cluster assignments from clustering algorithm
         reduced_data: Dimensionality-reduced data for visualization
+        _vis_2d: 2D projection of the processed data shown in the cluster plot
+        _pca_components: PCA components producing _vis_2d (None for a t-SNE embedding)
+        _pca_mean: PCA mean subtracted before projecting onto _pca_components
+        _results_df_cache: Results table reused by repeated saves
+        _elbow_running: Whether an elbow method sweep is in progress
+        _canvases: Plot canvases created so far, keyed by tab name
+        _processed_data_f32: Contiguous float32 copy of processed_data used by the elbow method
+        _data_generation: Number of times data or processed_data was replaced, identifying them in cache keys
+            and telling background runs whether their input is still current
+        _elbow_cache: Elbow method results of the processed data, keyed by its generation and the K values
+        _clustering_cache: Results of recent clustering runs, keyed by data generation and parameters
+        _elbow_line: Line of the last elbow curve drawn by find_optimal_k
+        _elbow_annotations: K labels of the points of _elbow_line
+        elbow_k_range: K values of the elbow curve of the last clustering run
+        elbow_curve: Inertia values of the elbow curve of the last clustering run
+        evaluation: Quality metrics of the last clustering run
+        silhouette_values: Per-sample silhouette values of the last clustering run
+        silhouette_labels: Cluster labels of the samples in silhouette_values
+        feature_importance: Feature importance scores of the last clustering run
         language_actions: Dictionary of language selection menu actions
     """
     
@@ -78,20 +97,39 @@ class ClusteringApp(QMainWindow):
         # Initialize UI components
         self.MatplotlibCanvas = ui_components['MatplotlibCanvas']
         
-        # Component initialization
-        self.data_loader = data_loader_class()
-        self.preprocessor = preprocessor_class()
+        # Component initialization (instances are created on first use)
+        self._data_loader_class = data_loader_class
+        self._preprocessor_class = preprocessor_class
         self.clustering_class = clustering_class
-        self.cluster_analyzer = cluster_analyzer_class()
-        self.visualizer = visualizer_class()
+        self._cluster_analyzer_class = cluster_analyzer_class
+        self._visualizer_class = visualizer_class
+        self._components = {}
+        self._canvases = {}
         
         # Data
         self.data = None
         self.processed_data = None
         self.labels = None
         self.reduced_data = None
+        self._vis_2d = None
+        self._pca_components = None
+        self._pca_mean = None
         self.original_columns = None
         self.kmeans = None
+        self._results_df_cache = None
+        self._elbow_running = False
+        self._processed_data_f32 = None
+        self._data_generation = 0
+        self._elbow_cache = {}
+        self._clustering_cache = {}
+        self._elbow_line = None
+        self._elbow_annotations = []
+        self.elbow_k_range = None
+        self.elbow_curve = None
+        self.evaluation = None
+        self.silhouette_values = None
+        self.silhouette_labels = None
+        self.feature_importance = None
         
         # Language actions
         self.language_actions = {}
@@ -117,4 +155,83 @@ class ClusteringApp(QMainWindow):
         self.update_tab_language = ui_components['update_tab_language'].__get__(self)
         
         # Interface setup
-        self.init_ui()
\ No newline at end of file
+        self.init_ui()
+
+    def _component(self, name, cls):
+        """
+        Get a component instance, creating it on first access.
+
+        Deferring instantiation keeps the modules of the components and
+        their dependencies from being imported before they are needed.
+
+        Parameters:
+            name: Key of the component
+            cls: Class of the component (possibly a LazyClass)
+
+        Returns:
+            The component instance
+        """
+        if name not in self._components:
+            self._components[name] = cls()
+
+        return self._components[name]
+
+    @property
+    def data_loader(self):
+        """Component for loading datasets from various sources."""
+        return self._component('data_loader', self._data_loader_class)
+
+    @property
+    def preprocessor(self):
+        """Component for data cleaning and transformation."""
+        return self._component('preprocessor', self._preprocessor_class)
+
+    @property
+    def cluster_analyzer(self):
+        """Component for evaluating clustering results."""
+        return self._component('cluster_analyzer', self._cluster_analyzer_class)
+
+    @property
+    def visualizer(self):
+        """Component for generating visualizations."""
+        return self._component('visualizer', self._visualizer_class)
+
+    def _canvas(self, name):
+        """
+        Get the plot canvas of a tab, creating it on first access.
+
+        Each canvas allocates a figure and its render buffer, so only the
+        canvases of tabs that are shown or plotted into are created.
+
+        Parameters:
+            name: Tab name ('clusters', 'elbow', 'silhouette' or 'features')
+
+        Returns:
+            The MatplotlibCanvas of the tab
+        """
+        if name not in self._canvases:
+            canvas = self.MatplotlibCanvas(width=8, height=6)
+            getattr(self, f'{name}_tab').layout().addWidget(canvas)
+            self._canvases[name] = canvas
+
+        return self._canvases[name]
+
+    @property
+    def clusters_canvas(self):
+        """Canvas for the cluster visualization."""
+        return self._canvas('clusters')
+
+    @property
+    def elbow_canvas(self):
+        """Canvas for the elbow method plot."""
+        return self._canvas('elbow')
+
+    @property
+    def silhouette_canvas(self):
+        """Canvas for the silhouette plot."""
+        return self._canvas('silhouette')
+
+    @property
+    def features_canvas(self):
+        """Canvas for the feature importance plot."""
+        return self._canvas('features')
@@ -4,8 +4,10 @@ Module for loading data.
 Provides interface functionality for loading data from different file formats.
 """
 
-import pandas as pd
-from PyQt5.QtWidgets import QFileDialog, QMessageBox
+import os
+import numpy as np
+from PyQt5.QtWidgets import QFileDialog
+from ._workers import Worker, start_worker, show_worker_error
 
 def load_data_from_file(self):
     """
@@ -18,7 +20,8 @@ def load_data_from_file(self):
             - results_text: Text widget to display information about loaded data
             
     Returns:
-        None: Data is stored as instance attributes:
+        None: The file is parsed in the background; once done, data is stored
+            as instance attributes:
             - data: NumPy array containing the loaded data
             - original_columns: List of column names from the original dataset
             
@@ -39,36 +42,200 @@ def load_data_from_file(self):
     
     if not file_path:
         return
+    
+    # Parse the file on a pool thread to keep the UI responsive
+    dtype = np.float32 if self.float32_check.isChecked() else np.float64
+    worker = Worker(_read_data_file, self.data_loader, file_path, dtype, report_progress=True)
+    worker.signals.progress.connect(
+        lambda percent: self.statusBar().showMessage(f"{tr('msg_loading_data')}: {percent}%")
+    )
+    worker.signals.finished.connect(lambda result: _on_data_loaded(self, file_path, result))
+    worker.signals.failed.connect(lambda message: _on_load_failed(self, message))
+    
+    # The menu action would otherwise start a second load replacing the data
+    self.load_data_btn.setEnabled(False)
+    self.action_open.setEnabled(False)
+    self.statusBar().showMessage(f"{tr('msg_loading_data')}...")
+    start_worker(self, worker)
+
+def _read_data_file(data_loader, file_path, dtype=np.float32, progress_callback=None):
+    """
+    Read a data file into a NumPy array.
+    
+    Runs on a worker thread and must not touch any widgets.
+    
+    Parameters:
+        data_loader: Component with methods for loading different file formats
+        file_path: Path to the file to load
+        dtype: Floating point type of the resulting array for numeric data
+        progress_callback: Optional callable receiving progress in percent
+        
+    Returns:
+        tuple: Data array, list of column names and file type description
+    """
+    
+    # Files are dispatched on their extension; unknown ones are parsed as CSV
+    extension = os.path.splitext(file_path)[1].lower()
+    file_type, reader = FILE_READERS.get(extension, ("Generic", _read_generic))
+    data, columns = reader(data_loader, file_path, dtype, progress_callback)
+            
+    # Numeric data is stored as one contiguous block of the selected type
+    if data.dtype.kind in 'biuf':
+        data = np.ascontiguousarray(data, dtype=dtype)
+        
+    return data, columns, file_type
+
+def _read_csv(data_loader, file_path, dtype, progress_callback):
+    """
+    Read a CSV file, streaming numeric data in chunks.
+    
+    Parameters:
+        data_loader: Component with methods for loading different file formats
+        file_path: Path to the file to load
+        dtype: Floating point type of the resulting array for numeric data
+        progress_callback: Optional callable receiving progress in percent
         
+    Returns:
+        tuple: Data array and list of column names
+    """
+    
     try:
+        return data_loader.load_csv_chunked(file_path, dtype=dtype, progress_callback=progress_callback)
+    
+    except ValueError:
+        
+        # Non-numeric columns, fall back to the DataFrame loader
+        return _frame_to_array(data_loader.load_csv(file_path), dtype)
+
+def _read_xlsx(data_loader, file_path, dtype, progress_callback):
+    """
+    Read an Excel workbook, streaming numeric data in chunks.
+    
+    Parameters:
+        data_loader: Component with methods for loading different file formats
+        file_path: Path to the file to load
+        dtype: Floating point type of the resulting array for numeric data
+        progress_callback: Optional callable receiving progress in percent
+        
+    Returns:
+        tuple: Data array and list of column names
+    """
+    
+    try:
+        return data_loader.load_excel_chunked(file_path, dtype=dtype, progress_callback=progress_callback)
+    
+    except (ValueError, TypeError):
+        
+        # Non-numeric cells, fall back to the DataFrame loader
+        return _frame_to_array(data_loader.load_excel(file_path), dtype)
+
+def _read_xls(data_loader, file_path, dtype, progress_callback):
+    """
+    Read a legacy Excel workbook.
+    
+    Parameters:
+        data_loader: Component with methods for loading different file formats
+        file_path: Path to the file to load
+        dtype: Floating point type of the resulting array for numeric data
+        progress_callback: Unused, legacy workbooks are read at once
+        
+    Returns:
+        tuple: Data array and list of column names
+    """
+    return _frame_to_array(data_loader.load_excel(file_path), dtype)
+
+def _read_npy(data_loader, file_path, dtype, progress_callback):
+    """
+    Read a NumPy array file.
+    
+    Parameters:
+        data_loader: Component with methods for loading different file formats
+        file_path: Path to the file to load
+        dtype: Unused, the type is applied by _read_data_file
+        progress_callback: Unused, arrays are read at once
         
-        if file_path.endswith('.csv'):
-            data_df = self.data_loader.load_csv(file_path)
-            self.original_columns = data_df.columns.tolist()
-            self.data = data_df.values
-            file_type = "CSV"
+    Returns:
+        tuple: Data array and list of generated column names
+    """
+    data = data_loader.load_numpy(file_path)
+    return data, [f"Feature_{i}" for i in range(data.shape[1])]
 
-        elif file_path.endswith(('.xlsx', '.xls')):
-            data_df = self.data_loader.load_excel(file_path)
-            self.original_columns = data_df.columns.tolist()
-            self.data = data_df.values
-            file_type = "Excel"
+def _read_generic(data_loader, file_path, dtype, progress_callback):
+    """
+    Read a file with an unknown extension as CSV.
+    
+    Parameters:
+        data_loader: Component with methods for loading different file formats
+        file_path: Path to the file to load
+        dtype: Floating point type of the resulting array for numeric data
+        progress_callback: Unused, the file is read at once
+        
+    Returns:
+        tuple: Data array and list of column names
+    """
+    import pandas as pd
+    
+    data = data_loader.load_csv(file_path)
 
-        elif file_path.endswith('.npy'):
-            self.data = self.data_loader.load_numpy(file_path)
-            self.original_columns = [f"Feature_{i}" for i in range(self.data.shape[1])]
-            file_type = "NumPy"
+    if isinstance(data, pd.DataFrame):
+        return _frame_to_array(data, dtype)
         
-        else:
-            self.data = self.data_loader.load_csv(file_path)
-            file_type = "Generic"
+    return data, [f"Feature_{i}" for i in range(data.shape[1])]
 
-            if isinstance(self.data, pd.DataFrame):
-                self.original_columns = self.data.columns.tolist()
-                self.data = self.data.values
+# File type description and reader of each supported file extension
+FILE_READERS = {
+    '.csv': ("CSV", _read_csv),
+    '.xlsx': ("Excel", _read_xlsx),
+    '.xls': ("Excel", _read_xls),
+    '.npy': ("NumPy", _read_npy),
+}
 
-            else:
-                self.original_columns = [f"Feature_{i}" for i in range(self.data.shape[1])]
+def _frame_to_array(data_df, dtype):
+    """
+    Convert a DataFrame to an array.
+    
+    Numeric frames are converted straight to the requested type, without
+    an intermediate float64 copy; if the frame already holds a single
+    block of that type, its memory is reused.
+    
+    Parameters:
+        data_df: Loaded DataFrame
+        dtype: Floating point type of the resulting array for numeric data
+        
+    Returns:
+        tuple: Data array and list of column names
+    """
+    columns = data_df.columns.tolist()
+    
+    if len(data_df.select_dtypes(include='number').columns) == len(columns):
+        return data_df.to_numpy(dtype=dtype, copy=False), columns
+    
+    # Non-numeric columns can only be represented as objects
+    return data_df.to_numpy(), columns
+
+def _on_data_loaded(self, file_path, result):
+    """
+    Store loaded data and display information about it.
+    
+    Parameters:
+        self: The parent application instance
+        file_path: Path to the loaded file
+        result: Tuple returned by _read_data_file
+    """
+    tr = self.translator
+    
+    self.load_data_btn.setEnabled(True)
+    self.action_open.setEnabled(True)
+    self.statusBar().clearMessage()
+    
+    try:
+        self.data, self.original_columns, file_type = result
+        self._results_df_cache = None
+        
+        # Runs started on the previous data are discarded when they finish
+        self._data_generation += 1
+        self._elbow_cache = {}
+        self._clustering_cache = {}
             
         self.update_data_info()
         
@@ -92,6 +259,17 @@ def load_data_from_file(self):
         self.results_text.setText(info_text)
 
     except Exception as e:
-        error_msg = f"{tr('msg_error')}: {str(e)}"
-        QMessageBox.critical(self, tr('msg_error'), error_msg)
-        self.results_text.setText(error_msg)
\ No newline at end of file
+        _on_load_failed(self, str(e))
+
+def _on_load_failed(self, message):
+    """
+    Display a data loading error to the user.
+    
+    Parameters:
+        self: The parent application instance
+        message: Error description
+    """
+    self.load_data_btn.setEnabled(True)
+    self.action_open.setEnabled(True)
+    self.statusBar().clearMessage()
+    show_worker_error(self, message)
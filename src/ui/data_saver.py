@@ -4,9 +4,21 @@ Module for saving data and clustering results.
 Provides interface functionality for exporting clustering results.
 """
 
+import os
+import re
+import logging
 import numpy as np
-import pandas as pd
 from PyQt5.QtWidgets import QFileDialog, QMessageBox
+from ._workers import Worker, start_worker, show_worker_error
+
+logger = logging.getLogger(__name__)
+
+# Number of rows formatted at a time by the pandas CSV writer
+CSV_WRITE_CHUNKSIZE = 100_000
+
+# Buffer size in bytes of files written directly, so that large results
+# are flushed in few write calls
+WRITE_BUFFER_SIZE = 4 * 1024 * 1024
 
 def save_results(self):
     """
@@ -18,11 +30,13 @@ def save_results(self):
             - labels: Cluster assignments
             - reduced_data: Dimensionality-reduced data (optional)
             - original_columns: Column names
+            - _results_df_cache: Results table from a previous save (optional)
             - translator: Localization handler
             - results_text: Text display widget
             
     Returns:
-        None: Results are saved to file; UI is updated with status
+        None: The file is written in the background; once done, the UI
+            is updated with status
         
     Raises:
         Exception: Errors during file saving are caught and displayed
@@ -39,87 +53,280 @@ def save_results(self):
             self,
             tr('file_save_title'),
             "",
-            tr('file_types'),
+            tr('file_save_types'),
             options=options
         )
         
         if not file_path:
             return
             
-        # Create DataFrame with original data and cluster labels
-        if self.original_columns is None:
-            self.original_columns = [f"Feature_{i}" for i in range(self.data.shape[1])]
+        if self._results_df_cache is None:
+            self._results_df_cache = _build_results_df(self)
             
-        results_df = pd.DataFrame(self.data, columns=self.original_columns)
-        results_df['cluster'] = self.labels
+        results_df = self._results_df_cache
         
-        # Add coordinates in reduced dimensionality if available
-        if self.reduced_data is not None and self.reduced_data.shape[1] == 2:
-            results_df['x_reduced'] = self.reduced_data[:, 0]
-            results_df['y_reduced'] = self.reduced_data[:, 1]
+        # Take the extension from the selected filter if none was typed
+        if not os.path.splitext(file_path)[1]:
+            match = re.search(r'\*(\.\w+)', selected_filter)
+            file_path += match.group(1) if match else '.csv'
+            
+    except Exception as e:
+        show_worker_error(self, str(e))
+        return
         
-        # Save according to selected format
-        if file_path.endswith('.csv') or selected_filter == "CSV files (*.csv)":
-
-            if not file_path.endswith('.csv'):
-                file_path += '.csv'
-
-            results_df.to_csv(file_path, index=False)
-            file_type = "CSV"
-
-        elif file_path.endswith('.xlsx') or selected_filter == "Excel files (*.xlsx)":
-
-            if not file_path.endswith('.xlsx'):
-                file_path += '.xlsx'
-
-            results_df.to_excel(file_path, index=False)
-            file_type = "Excel"
+    # Write the file on a pool thread to keep the UI responsive
+    worker = Worker(_write_results, results_df, file_path)
+    worker.signals.finished.connect(lambda result: _on_results_saved(self, results_df, *result))
+    worker.signals.failed.connect(lambda message: _on_save_failed(self, message))
+    
+    # The menu action would otherwise start a second write, possibly to the same file
+    self.save_results_btn.setEnabled(False)
+    self.action_save_results.setEnabled(False)
+    self.statusBar().showMessage(f"{tr('msg_saving_results')}...")
+    start_worker(self, worker)
 
-        elif file_path.endswith('.npy') or selected_filter == "NumPy files (*.npy)":
+def _write_results(results_df, file_path):
+    """
+    Write the results table in the format given by the file extension.
+    
+    Runs on a worker thread and must not touch any widgets.
+    
+    Parameters:
+        results_df: Results table
+        file_path: Path to the output file
+        
+    Returns:
+        tuple: Path of the written file and file type description
+    """
+    
+    # Save according to selected format; other extensions get a .csv suffix
+    extension = os.path.splitext(file_path)[1].lower()
+    
+    if extension in FILE_WRITERS:
+        file_type, writer = FILE_WRITERS[extension]
+        
+    else:
+        file_path += '.csv'
+        file_type, writer = "CSV (default)", _write_csv
+        
+    writer(results_df, file_path)
+    return file_path, file_type
 
-            if not file_path.endswith('.npy'):
-                file_path += '.npy'
+def _on_results_saved(self, results_df, file_path, file_type):
+    """
+    Display information about the saved results.
+    
+    Parameters:
+        self: Parent application
+        results_df: Results table that was saved
+        file_path: Path of the written file
+        file_type: File type description
+    """
+    tr = self.translator
+    
+    self.save_results_btn.setEnabled(True)
+    self.action_save_results.setEnabled(True)
+    self.statusBar().clearMessage()
+    
+    # Save the path for localization purposes
+    self.last_save_path = file_path
+    
+    # Create result message
+    info_text = f"{tr('msg_results_saved')}\n\n"
+    info_text += f"{tr('file_save_title')}: {file_path}\n"
+    info_text += f"{tr('data_preview')}: {file_type}\n"
+    
+    if file_type != "NumPy (only cluster labels)":
+        info_text += f"{tr('data_features')}: {len(results_df.columns)}\n"
+        info_text += f"{tr('data_samples')}: {len(results_df)}\n"
+        
+        # Add column names
+        info_text += f"\n{tr('data_features')}: "
+        column_names = results_df.columns.tolist()
+        info_text += ", ".join(column_names[:10])
+        
+        if len(column_names) > 10:
+            info_text += f" {tr('data_features')} {len(column_names) - 10}..."
 
-            # For NumPy, save only the array with cluster labels
-            np.save(file_path, self.labels)
-            file_type = "NumPy (only cluster labels)"
+    else:
+        info_text += f"{tr('plot_cluster')}: {len(self.labels)}\n"
+    
+    # Display in text area
+    self.results_text.setText(info_text)
 
-        else:
+def _on_save_failed(self, message):
+    """
+    Re-enable the save button and display the error.
+    
+    Parameters:
+        self: Parent application
+        message: Error description
+    """
+    self.save_results_btn.setEnabled(True)
+    self.action_save_results.setEnabled(True)
+    self.statusBar().clearMessage()
+    show_worker_error(self, message)
 
-            # Default save as CSV
-            if not file_path.endswith('.csv'):
-                file_path += '.csv'
+def _build_results_df(self):
+    """
+    Assemble the table of original data, cluster labels and 2D coordinates.
+    
+    Columns are passed one by one, so each column of the data is taken
+    as a 1D view instead of restriding the whole 2D array.
+    
+    Parameters:
+        self: Parent application with data, labels, reduced_data and original_columns
+        
+    Returns:
+        DataFrame: Results table
+    """
+    import pandas as pd
+    
+    # Create DataFrame with original data and cluster labels
+    if self.original_columns is None:
+        self.original_columns = [f"Feature_{i}" for i in range(self.data.shape[1])]
+        
+    columns = {name: self.data[:, i] for i, name in enumerate(self.original_columns)}
+    columns['cluster'] = self.labels
+    
+    # Add coordinates in reduced dimensionality if available
+    if self.reduced_data is not None and self.reduced_data.shape[1] == 2:
+        columns['x_reduced'] = self.reduced_data[:, 0]
+        columns['y_reduced'] = self.reduced_data[:, 1]
+        
+    return pd.DataFrame(columns, copy=False)
 
-            results_df.to_csv(file_path, index=False)
-            file_type = "CSV (default)"
+def _write_csv(results_df, file_path):
+    """
+    Write a DataFrame to a CSV file.
+    
+    Uses the multithreaded pyarrow writer if it is installed,
+    falling back to pandas, which formats CSV_WRITE_CHUNKSIZE rows
+    at a time to bound the size of its text buffer and writes them
+    through a WRITE_BUFFER_SIZE file buffer.
+    
+    Parameters:
+        results_df: DataFrame to write
+        file_path: Path to the CSV file
+    """
+    
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pac
         
-        # Save the path for localization purposes
-        self.last_save_path = file_path
+    except ImportError:
+        table = None
         
-        # Create result message
-        info_text = f"{tr('msg_results_saved')}\n\n"
-        info_text += f"{tr('file_save_title')}: {file_path}\n"
-        info_text += f"{tr('data_preview')}: {file_type}\n"
+    else:
         
-        if file_type != "NumPy (only cluster labels)":
-            info_text += f"{tr('data_features')}: {len(results_df.columns)}\n"
-            info_text += f"{tr('data_samples')}: {len(results_df)}\n"
+        # The table is built straight from the column arrays, which
+        # numeric columns share with the data, instead of converting
+        # the frame with its pandas metadata
+        try:
+            table = pa.Table.from_arrays(
+                [pa.array(results_df[name].to_numpy()) for name in results_df.columns],
+                names=[str(name) for name in results_df.columns]
+            )
             
-            # Add column names
-            info_text += f"\n{tr('data_features')}: "
-            column_names = results_df.columns.tolist()
-            info_text += ", ".join(column_names[:10])
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as e:
+            logger.debug("pyarrow could not convert the results, writing %s with pandas: %s", file_path, e)
+            table = None
             
-            if len(column_names) > 10:
-                info_text += f" {tr('data_features')} {len(column_names) - 10}..."
+    # Only conversion errors fall back to pandas; errors while writing are
+    # raised, so a partially written file is never written a second time
+    if table is not None:
+        pac.write_csv(table, file_path)
+        
+    else:
+        with open(file_path, 'w', newline='', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            results_df.to_csv(f, index=False, chunksize=CSV_WRITE_CHUNKSIZE)
 
-        else:
-            info_text += f"{tr('plot_cluster')}: {len(self.labels)}\n"
+def _write_excel(results_df, file_path):
+    """
+    Write a DataFrame to an .xlsx file row by row.
+    
+    Uses xlsxwriter in constant memory mode if it is installed, falling
+    back to a write-only openpyxl workbook; both stream the rows to disk
+    instead of keeping a cell object for every value in memory.
+    
+    Parameters:
+        results_df: DataFrame to write
+        file_path: Path to the Excel file
+    """
+    
+    # Missing values are written as empty cells
+    rows = (
+        [None if value != value else value for value in row]
+        for row in results_df.itertuples(index=False, name=None)
+    )
+    
+    try:
+        import xlsxwriter
         
-        # Display in text area
-        self.results_text.setText(info_text)
-   
-    except Exception as e:
-        error_msg = f"{tr('msg_error')}: {str(e)}"
-        QMessageBox.critical(self, tr('msg_error'), error_msg)
-        self.results_text.setText(error_msg)
\ No newline at end of file
+    except ImportError:
+        from openpyxl import Workbook
+        
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet()
+        sheet.append([str(name) for name in results_df.columns])
+        
+        for row in rows:
+            sheet.append(row)
+            
+        workbook.save(file_path)
+        return
+    
+    # Constant memory mode flushes each row once the next one is started,
+    # so rows have to be written in order
+    with xlsxwriter.Workbook(file_path, {'constant_memory': True}) as workbook:
+        sheet = workbook.add_worksheet()
+        sheet.write_row(0, 0, [str(name) for name in results_df.columns])
+        
+        for i, row in enumerate(rows, start=1):
+            sheet.write_row(i, 0, row)
+
+def _write_parquet(results_df, file_path):
+    """
+    Write a DataFrame to a zstd-compressed Parquet file.
+    
+    Parameters:
+        results_df: DataFrame to write
+        file_path: Path to the Parquet file
+    """
+    results_df.to_parquet(file_path, engine='pyarrow', compression='zstd', index=False)
+
+def _write_feather(results_df, file_path):
+    """
+    Write a DataFrame to a zstd-compressed Feather file.
+    
+    Parameters:
+        results_df: DataFrame to write
+        file_path: Path to the Feather file
+    """
+    results_df.to_feather(file_path, compression='zstd')
+
+def _write_labels(results_df, file_path):
+    """
+    Write only the cluster labels of a results table to a .npy file.
+    
+    Labels are stored in the smallest integer type holding all of them.
+    
+    Parameters:
+        results_df: Results table with a 'cluster' column
+        file_path: Path to the .npy file
+    """
+    labels = results_df['cluster'].to_numpy()
+    label_dtype = np.int16 if len(labels) == 0 or labels.max() <= np.iinfo(np.int16).max else np.int32
+    
+    # np.save would append .npy to a path with an upper case extension
+    with open(file_path, 'wb', buffering=WRITE_BUFFER_SIZE) as f:
+        np.save(f, np.ascontiguousarray(labels, dtype=label_dtype), allow_pickle=False)
+
+# File type description and writer of each supported file extension
+FILE_WRITERS = {
+    '.parquet': ("Parquet", _write_parquet),
+    '.feather': ("Feather", _write_feather),
+    '.csv': ("CSV", _write_csv),
+    '.xlsx': ("Excel", _write_excel),
+    '.npy': ("NumPy (only cluster labels)", _write_labels),
+}
@@ -5,9 +5,14 @@ Provides functions to update all UI elements
 when the application language is changed.
 """
 
+import logging
 from PyQt5.QtWidgets import QDialog, QGroupBox, QFormLayout, QLabel, QPushButton
 from PyQt5.QtCore import Qt
 import numpy as np
+from ._init_ui import MENU_SPEC
+from ._perform_clustering import format_clustering_results
+
+logger = logging.getLogger(__name__)
 
 
 def update_ui_language(self):
@@ -49,7 +54,7 @@ def update_ui_language(self):
             update_visualization_language(self)
 
         except Exception as e:
-            print(f"Error updating visualization language: {str(e)}")
+            logger.warning("Error updating visualization language: %s", e)
 
 
 def update_menu_language(self):
@@ -61,26 +66,15 @@ def update_menu_language(self):
     """
     tr = self.translator.translate
     
-    if hasattr(self, 'menu_file'):
-        self.menu_file.setTitle(tr('menu_file'))
-        self.action_open.setText(tr('menu_open'))
-        self.action_exit.setText(tr('menu_exit'))
-        
-    if hasattr(self, 'menu_data'):
-        self.menu_data.setTitle(tr('menu_data'))
-        self.action_preprocess.setText(tr('menu_preprocess'))
-        
-    if hasattr(self, 'menu_analysis'):
-        self.menu_analysis.setTitle(tr('menu_analysis'))
-        self.action_perform_clustering.setText(tr('menu_perform_clustering'))
-        
-    if hasattr(self, 'menu_results'):
-        self.menu_results.setTitle(tr('menu_results'))
-        self.action_save_results.setText(tr('menu_save_results'))
-        self.action_visualize.setText(tr('menu_visualize'))
-        
-    if hasattr(self, 'menu_settings'):
-        self.menu_settings.setTitle(tr('menu_settings'))
+    for menu_key, actions in MENU_SPEC:
+        
+        if hasattr(self, menu_key):
+            getattr(self, menu_key).setTitle(tr(menu_key))
+            
+            for action_name, text_key, _ in actions:
+                getattr(self, action_name).setText(tr(text_key))
+        
+    if hasattr(self, 'menu_language'):
         self.menu_language.setTitle(tr('menu_language'))
         
         # Update language menu items
@@ -88,10 +82,6 @@ def update_menu_language(self):
             action.setChecked(lang == self.current_language)
             lang_key = f'menu_language_{lang}'
             action.setText(tr(lang_key))
-        
-    if hasattr(self, 'menu_help'):
-        self.menu_help.setTitle(tr('menu_help'))
-        self.action_about.setText(tr('menu_about'))
 
 
 def update_tab_language(self):
@@ -158,6 +148,12 @@ def update_ui_elements_language(self):
     if hasattr(self, 'save_results_btn'):
         self.save_results_btn.setText(tr('button_save'))
         
+    if hasattr(self, 'float32_check'):
+        self.float32_check.setText(tr('data_use_float32'))
+        
+    if hasattr(self, 'minibatch_check'):
+        self.minibatch_check.setText(tr('clustering_minibatch'))
+        
     # Update all buttons that might not have been processed above
     for btn in self.findChildren(QPushButton):
         btn_text = btn.text()
@@ -238,6 +234,9 @@ def update_ui_elements_language(self):
 
                     elif 'итераций' in text.lower() or 'iter' in text.lower() or 'максим' in text.lower():
                         label.setText(tr('clustering_max_iter') + ":")
+
+                    elif 'backend' in text.lower() or 'реализац' in text.lower():
+                        label.setText(tr('clustering_backend') + ":")
     
     # Update all texts in visualization tabs
     for tab in [self.clusters_tab, self.elbow_tab, self.silhouette_tab, self.features_tab]:
@@ -304,9 +303,6 @@ def change_language(self, language):
                 if hasattr(self, 'clusters_canvas') and self.clusters_canvas:
                     self.clusters_canvas.axes.clear()
                     
-                if hasattr(self, 'elbow_canvas') and self.elbow_canvas:
-                    self.elbow_canvas.axes.clear()
-                    
                 if hasattr(self, 'silhouette_canvas') and self.silhouette_canvas:
                     self.silhouette_canvas.axes.clear()
                     
@@ -314,7 +310,7 @@ def change_language(self, language):
                     self.features_canvas.axes.clear()
 
             except Exception as e:
-                print(f"Error clearing plots: {str(e)}")
+                logger.warning("Error clearing plots: %s", e)
         
         # Update the entire interface with the new language
         update_ui_language(self)
@@ -331,10 +327,8 @@ def change_language(self, language):
                 # Try to update visualizations
                 update_visualization_language(self)
 
-            except Exception as e:
-                print(f"Error updating visualization language: {str(e)}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                logger.exception("Error updating visualization language")
             
             # Redraw all plots with error handling
             try:
@@ -349,7 +343,7 @@ def change_language(self, language):
                             canvas.draw()
 
             except Exception as e:
-                print(f"Error redrawing plots: {str(e)}")
+                logger.warning("Error redrawing plots: %s", e)
             
         # Update all child dialogs
         for dialog in self.findChildren(QDialog):
@@ -360,7 +354,7 @@ def change_language(self, language):
                     dialog.update_language()
 
                 except Exception as e:
-                    print(f"Error updating dialog language: {str(e)}")
+                    logger.warning("Error updating dialog language: %s", e)
         
     finally:
         QApplication.restoreOverrideCursor()
@@ -396,7 +390,7 @@ def update_visualization_language(self):
         update_vis(self)
 
     except Exception as e:
-        print(f"Error updating visualization: {str(e)}")
+        logger.warning("Error updating visualization: %s", e)
 
 
 def update_results_text(self):
@@ -417,61 +411,36 @@ def update_results_text(self):
         current_text = self.results_text.toPlainText()
         
         # Check what is currently displayed in the text field
-        if hasattr(self, 'labels') and self.labels is not None and hasattr(self, 'kmeans') and self.kmeans is not None:
+        if hasattr(self, 'labels') and self.labels is not None and self.evaluation is not None:
             
             try:
 
-                # Get metrics from the model
-                evaluation = self.kmeans.evaluate(self.processed_data)
+                # Metrics of the last run; evaluating again would repeat the
+                # silhouette computation and use the data before reduction
+                evaluation = self.evaluation
                 
                 # Gather clustering information
-                n_clusters = len(np.unique(self.labels))
-                
-                # Generate new results text
-                info_text = f"{tr('clustering_results')}:\n\n"
-                info_text += f"{tr('clustering_k')}: {n_clusters}\n"
-                
-                if 'inertia' in evaluation:
-                    info_text += f"{tr('metric_inertia')}: {evaluation['inertia']:.4f}\n"
-                
-                if 'silhouette_score' in evaluation:
-                    info_text += f"{tr('metric_silhouette')}: {evaluation['silhouette_score']:.4f}\n"
-                
-                if 'calinski_harabasz_score' in evaluation:
-                    info_text += f"{tr('metric_calinski_harabasz')}: {evaluation['calinski_harabasz_score']:.4f}\n"
-                
-                if 'davies_bouldin_score' in evaluation:
-                    info_text += f"{tr('metric_davies_bouldin')}: {evaluation['davies_bouldin_score']:.4f}\n"
-                
-                # Add information about cluster sizes
-                info_text += f"\n{tr('plot_cluster')}:\n"
-                unique_labels, counts = np.unique(self.labels, return_counts=True)
-                
-                for label, count in zip(unique_labels, counts):
-                    info_text += f"{tr('plot_cluster')} {label}: {count} {tr('data_samples')}\n"
+                n_clusters = np.count_nonzero(np.bincount(self.labels))
                 
                 # Update text in the results field
-                self.results_text.setText(info_text)
+                self.results_text.setText(format_clustering_results(tr, n_clusters, evaluation, self.labels))
                 return
                 
             except Exception as e:
-                print(f"Error updating clustering results text: {str(e)}")
+                logger.warning("Error updating clustering results text: %s", e)
         
         # Optimal K search results
-        if 'k = ' in current_text and hasattr(self, 'elbow_k_range') and hasattr(self, 'elbow_curve'):
+        if 'k = ' in current_text and self.elbow_k_range is not None and self.elbow_curve is not None:
            
             try:
-                info_text = f"{tr('optimal_k_results')}\n\n"
-                info_text += f"{tr('metric_inertia')}:\n"
-                
-                for k, inertia in zip(self.elbow_k_range, self.elbow_curve):
-                    info_text += f"k = {k}: {inertia:.2f}\n"
+                lines = [f"k = {k}: {inertia:.2f}" for k, inertia in zip(self.elbow_k_range, self.elbow_curve)]
+                info_text = f"{tr('optimal_k_results')}\n\n{tr('metric_inertia')}:\n" + "\n".join(lines) + "\n"
                 
                 self.results_text.setText(info_text)
                 return
                 
             except Exception as e:
-                print(f"Error updating optimal k results text: {str(e)}")
+                logger.warning("Error updating optimal k results text: %s", e)
         
         # Preprocessing message
         if tr('msg_preprocessing_done') in current_text or "preprocessing" in current_text.lower() or "предобработка" in current_text.lower():
@@ -498,7 +467,7 @@ def update_results_text(self):
             return
         
     except Exception as e:
-        print(f"Error in update_results_text: {str(e)}")
+        logger.warning("Error in update_results_text: %s", e)
 
 
 __all__ = [
@@ -5,10 +5,11 @@ Provides functionality for creating and updating visualization
 of clustering results.
 """
 
+import logging
 import numpy as np
 from PyQt5.QtWidgets import QMessageBox
-import matplotlib.pyplot as plt
-from matplotlib.colors import ListedColormap
+
+logger = logging.getLogger(__name__)
 
 def visualize_results(self):
     """
@@ -70,8 +71,7 @@ def visualize_results(self):
         update_cluster_visualization(self)
         
         # Update elbow method plot if data is available
-        if hasattr(self, 'elbow_k_range') and hasattr(self, 'elbow_curve') and \
-           self.elbow_k_range is not None and self.elbow_curve is not None:
+        if self.elbow_k_range is not None and self.elbow_curve is not None:
             
             try:
 
@@ -105,7 +105,7 @@ def visualize_results(self):
                 self.elbow_canvas.draw()
 
             except Exception as e:
-                print(f"Error updating elbow plot: {str(e)}")
+                logger.warning("Error updating elbow plot: %s", e)
         
         # Update other plots
         update_tabs_visualization(self)
@@ -115,9 +115,7 @@ def visualize_results(self):
             self.tabs.setCurrentIndex(0)
         
     except Exception as e:
-        print(f"Error in visualization: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Error in visualization")
         
         # Show error message
         QMessageBox.warning(
@@ -138,6 +136,8 @@ def update_cluster_visualization(self):
         self: Parent application with:
             - clusters_canvas: Canvas for cluster visualization
             - reduced_data: 2D data for visualization
+            - _vis_2d: Cached 2D projection of the processed data
+            - _pca_components, _pca_mean: PCA projection producing _vis_2d
             - labels: Cluster assignments
             - translator: Localization handler
             - kmeans: Clustering model with centroids (optional)
@@ -160,18 +160,22 @@ def update_cluster_visualization(self):
         new_axes = new_figure.add_subplot(111)
         
         # Create color map and scatter points by class
-        unique_labels = sorted(set(self.labels))
+        unique_labels, label_index = np.unique(self.labels, return_inverse=True)
         colors = plt.cm.viridis(np.linspace(0, 1, len(unique_labels)))
         cmap = ListedColormap(colors)
         
-        # Plot scatter graph
+        # Plot the cached 2D projection computed during preprocessing
+        vis_data = self._vis_2d if self._vis_2d is not None else self.reduced_data
+        
+        # Plot scatter graph; colors are looked up directly instead of being
+        # normalized through the colormap, and marker edges are not stroked
         scatter = new_axes.scatter(
-            self.reduced_data[:, 0],
-            self.reduced_data[:, 1],
-            c=self.labels,
-            cmap=cmap,
+            vis_data[:, 0],
+            vis_data[:, 1],
+            c=colors[label_index],
             s=30,
-            alpha=0.8
+            alpha=0.8,
+            linewidths=0
         )
         
         legend_elements = [plt.Line2D([0], [0], marker='o', color='w', 
@@ -191,41 +195,16 @@ def update_cluster_visualization(self):
             
             try:
                 
-                # Transform centroids to the same space as reduced_data
+                # Transform centroids to the same space as the plotted data;
+                # a t-SNE embedding has no mapping for new points
                 reduced_centers = None
                 
-                # If we have a dimensionality reducer and it was trained
-                if hasattr(self, 'dimensionality_reducer') and self.dimensionality_reducer is not None:
+                if self._pca_components is not None:
+                    centers = self.kmeans.cluster_centers_.astype(np.float32)
+                    reduced_centers = (centers - self._pca_mean) @ self._pca_components.T
                     
-                    # Check if dimensionality reducer can be used (it was already trained)
-                    if hasattr(self.dimensionality_reducer, 'components_'):
-                        
-                        # Apply dimensionality reduction directly to centroids
-                        try:
-                            print(f"Attempting to transform centroids from shape {self.kmeans.cluster_centers_.shape}")
-                            reduced_centers = self.dimensionality_reducer.transform(self.kmeans.cluster_centers_)
-                            print(f"Centroids transformed using dimensionality reducer. Shape: {reduced_centers.shape}")
-                        
-                        except Exception as e:
-                            print(f"Error transforming centroids: {str(e)}")
-                
-                # If no dimensionality reducer is used, check if centroids are already in 2D space
-                elif self.kmeans.cluster_centers_.shape[1] == 2:
+                elif self._vis_2d is None and self.kmeans.cluster_centers_.shape[1] == 2:
                     reduced_centers = self.kmeans.cluster_centers_
-                    print(f"Using original 2D centroids. Shape: {reduced_centers.shape}")
-                
-                else:
-                    print(f"Falling back to PCA for centroid dimensionality reduction. Centroid shape: {self.kmeans.cluster_centers_.shape}")
-                    
-                    # Try to reduce centroid dimensionality with PCA
-                    try:
-                        from sklearn.decomposition import PCA
-                        pca = PCA(n_components=2)
-                        reduced_centers = pca.fit_transform(self.kmeans.cluster_centers_)
-                        print(f"Successfully reduced centroids to 2D with PCA. New shape: {reduced_centers.shape}")
-                   
-                    except Exception as e:
-                        print(f"Error applying PCA to centroids: {str(e)}")
                 
                 # Add centroids to plot only if they were successfully obtained
                 if reduced_centers is not None:
@@ -257,7 +236,7 @@ def update_cluster_visualization(self):
                     self.clusters_legend = new_axes.legend(handles=legend_elements, loc='best')
 
             except Exception as e:
-                print(f"Error plotting cluster centers: {str(e)}")
+                logger.warning("Error plotting cluster centers: %s", e)
         
         # Apply tight_layout for optimal space usage
         new_figure.tight_layout()
@@ -269,10 +248,8 @@ def update_cluster_visualization(self):
         # Close old figure to free resources
         plt.close(current_figure)
         
-    except Exception as e:
-        print(f"Detailed error in cluster visualization: {str(e)}")
-        import traceback
-        traceback.print_exc()
+    except Exception:
+        logger.exception("Detailed error in cluster visualization")
 
 def update_tabs_visualization(self):
     """
@@ -286,6 +263,7 @@ def update_tabs_visualization(self):
             - silhouette_canvas: Canvas for silhouette plot
             - features_canvas: Canvas for feature importance plot
             - silhouette_values: Silhouette scores for each sample
+            - silhouette_labels: Cluster labels of the samples in silhouette_values
             - labels: Cluster assignments
             - feature_importance: Importance scores for features
             - translator: Localization handler
@@ -294,7 +272,7 @@ def update_tabs_visualization(self):
     import matplotlib.pyplot as plt
     
     # Update silhouette coefficients plot if data is available
-    if hasattr(self, 'silhouette_values') and self.silhouette_values is not None:
+    if self.silhouette_values is not None:
         
         # Check that we have necessary data for plotting
         if len(self.silhouette_values) > 0 and self.labels is not None:
@@ -314,14 +292,20 @@ def update_tabs_visualization(self):
                 
                 y_lower = 10
                 
+                # Silhouette values may cover only a subset of the samples
+                silhouette_labels = self.silhouette_labels
+                
+                if silhouette_labels is None:
+                    silhouette_labels = self.labels
+                
                 # Get unique clusters
-                unique_clusters = np.unique(self.labels)
+                unique_clusters = np.unique(silhouette_labels)
                 
                 # Plot silhouette coefficients for each cluster
                 for i in unique_clusters:
 
                     # Get silhouette coefficients for current cluster
-                    cluster_silhouette_values = self.silhouette_values[self.labels == i]
+                    cluster_silhouette_values = self.silhouette_values[silhouette_labels == i]
                     
                     # Skip if empty cluster
                     if len(cluster_silhouette_values) == 0:
@@ -370,13 +354,11 @@ def update_tabs_visualization(self):
                 # Close old figure to free resources
                 plt.close(current_figure)
 
-            except Exception as e:
-                print(f"Error updating silhouette plot: {str(e)}")
-                import traceback
-                traceback.print_exc()
+            except Exception:
+                logger.exception("Error updating silhouette plot")
     
     # Update feature importance plot if data is available
-    if hasattr(self, 'feature_importance') and self.feature_importance is not None:
+    if self.feature_importance is not None:
 
         try:
 
@@ -428,7 +410,5 @@ def update_tabs_visualization(self):
             # Close old figure to free resources
             plt.close(current_figure)
         
-        except Exception as e:
-                print(f"Error updating feature importance plot: {str(e)}")
-                import traceback
-                traceback.print_exc()
\ No newline at end of file
+        except Exception:
+                logger.exception("Error updating feature importance plot")
\ No newline at end of file
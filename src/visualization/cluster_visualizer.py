@@ -2,6 +2,7 @@
 Visualization module for clustering results.
 """
 
+import logging
 import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
@@ -11,6 +12,20 @@ from matplotlib.figure import Figure
 from sklearn.decomposition import PCA
 from sklearn.manifold import TSNE
 
+try:
+    import cupy
+    from cuml.decomposition import PCA as PCAGpu
+    from cuml.manifold import TSNE as TSNEGpu
+    CUML_AVAILABLE = True
+
+except ImportError:
+    CUML_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Number of PCA components data is reduced to before running t-SNE
+TSNE_MAX_INPUT_DIMS = 50
+
 class ClusterVisualizer:
     
     def __init__(self, figsize: Tuple[int, int] = (10, 8), style: str = 'whitegrid'):
@@ -98,31 +113,96 @@ class ClusterVisualizer:
                          data: np.ndarray, 
                          method: str = 'pca',
                          n_components: int = 2,
-                         random_state: Optional[int] = 42) -> np.ndarray:
+                         random_state: Optional[int] = 42,
+                         backend: str = 'auto') -> np.ndarray:
         """
         Reduce data dimensionality for visualization.
         
         Args:
-            data: High-dimensional input data
+            data: High-dimensional input data (reduced to TSNE_MAX_INPUT_DIMS
+                with PCA before t-SNE if wider)
             method: Dimensionality reduction method ('pca' or 'tsne')
             n_components: Number of components to retain
             random_state: Random state for reproducibility
+            backend: 'auto' to use cuML on the GPU when it is available,
+                'sklearn' to always run on the CPU
             
         Returns:
             Reduced-dimensionality data
         """
 
+        if method not in ('pca', 'tsne'):
+            raise ValueError(f"Unknown dimensionality reduction method: {method}")
+            
+        # t-SNE cost grows with the input dimensionality, so wide data is
+        # first compressed with PCA, which also removes noisy directions
+        if method == 'tsne' and data.shape[1] > TSNE_MAX_INPUT_DIMS:
+            data = self.reduce_dimensions(
+                data,
+                method='pca',
+                n_components=TSNE_MAX_INPUT_DIMS,
+                random_state=random_state,
+                backend=backend
+            )
+            
+        # cuML Barnes-Hut t-SNE only supports two components
+        if backend == 'auto' and (method == 'pca' or n_components <= 2):
+            reduced_data = self._reduce_gpu(data, method, n_components, random_state)
+            
+            if reduced_data is not None:
+                return reduced_data
+
         if method == 'pca':
-            reducer = PCA(n_components=n_components, random_state=random_state)
+            reducer = PCA(
+                n_components=n_components,
+                svd_solver='randomized' if n_components < min(data.shape) else 'auto',
+                n_oversamples=5,
+                random_state=random_state
+            )
         
-        elif method == 'tsne':
-            reducer = TSNE(n_components=n_components, random_state=random_state)
-       
         else:
-            raise ValueError(f"Unknown dimensionality reduction method: {method}")
+            reducer = TSNE(n_components=n_components, random_state=random_state)
             
         return reducer.fit_transform(data)
     
+    def _reduce_gpu(self,
+                    data: np.ndarray,
+                    method: str,
+                    n_components: int,
+                    random_state: Optional[int] = 42) -> Optional[np.ndarray]:
+        """
+        Reduce data dimensionality on the GPU with cuML.
+        
+        Args:
+            data: High-dimensional input data
+            method: Dimensionality reduction method ('pca' or 'tsne')
+            n_components: Number of components to retain
+            random_state: Random state for reproducibility
+            
+        Returns:
+            Reduced-dimensionality data, or None if cuML or a GPU is not available
+            
+        Raises:
+            Exception: Errors of cuML other than a missing GPU or GPU memory
+        """
+        
+        if not CUML_AVAILABLE:
+            return None
+
+        try:
+            
+            if method == 'pca':
+                reducer = PCAGpu(n_components=n_components, random_state=random_state)
+                
+            else:
+                reducer = TSNEGpu(n_components=n_components, random_state=random_state)
+                
+            return cupy.asnumpy(reducer.fit_transform(cupy.asarray(data)))
+        
+        except (cupy.cuda.runtime.CUDARuntimeError, cupy.cuda.memory.OutOfMemoryError) as e:
+            logger.warning("cuML %s failed on the GPU, falling back to scikit-learn: %s", method, e)
+            return None
+    
     def plot_elbow_method(self,
                          k_values: List[int],
                          inertia_values: List[float],
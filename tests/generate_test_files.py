@@ -124,8 +124,8 @@ def generate_random_data(n_samples=100, n_features=2, random_state=42):
     Returns:
         Array X with data
     """
-    np.random.seed(random_state)
-    X = np.random.randn(n_samples, n_features)
+    rng = np.random.default_rng(random_state)
+    X = rng.standard_normal((n_samples, n_features))
     
     return X
 
@@ -0,0 +1,137 @@
+"""
+Tests of the streaming file loaders.
+"""
+
+import sys
+import numpy as np
+import pytest
+from src.data_processing.data_loader import DataLoader
+
+@pytest.fixture(params=['pyarrow', 'pandas'])
+def csv_parser(request, monkeypatch):
+    """Run a test with the pyarrow reader and with the pandas fallback."""
+
+    if request.param == 'pyarrow':
+        pytest.importorskip('pyarrow')
+
+    else:
+
+        # A None entry makes the import raise ImportError
+        monkeypatch.setitem(sys.modules, 'pyarrow', None)
+        monkeypatch.setitem(sys.modules, 'pyarrow.csv', None)
+
+    return request.param
+
+def write_text(path, text):
+    path.write_text(text, encoding='utf-8')
+    return str(path)
+
+def test_load_csv_chunked_numeric(tmp_path, csv_parser):
+    expected = np.random.default_rng(0).random((50, 3))
+    file_path = tmp_path / 'data.csv'
+    np.savetxt(file_path, expected, delimiter=',', header='a,b,c', comments='')
+
+    data, columns = DataLoader.load_csv_chunked(str(file_path), chunksize=7, dtype=np.float64)
+
+    assert columns == ['a', 'b', 'c']
+    np.testing.assert_allclose(data, expected)
+
+def test_load_csv_chunked_skips_blank_lines(tmp_path, csv_parser):
+    file_path = write_text(tmp_path / 'data.csv', "a,b\n1,2\n\n3,4\n\n\n5,6\n\n")
+
+    data, columns = DataLoader.load_csv_chunked(file_path, chunksize=2)
+
+    assert columns == ['a', 'b']
+    assert data.dtype == np.float32
+    np.testing.assert_array_equal(data, [[1, 2], [3, 4], [5, 6]])
+
+def test_load_csv_chunked_missing_values(tmp_path, csv_parser):
+    file_path = write_text(tmp_path / 'data.csv', "a,b\n1,\n2,\n")
+
+    data, _ = DataLoader.load_csv_chunked(file_path)
+
+    np.testing.assert_array_equal(data[:, 0], [1, 2])
+    assert np.isnan(data[:, 1]).all()
+
+def test_load_csv_chunked_header_only(tmp_path, csv_parser):
+    file_path = write_text(tmp_path / 'data.csv', "a,b,c\n")
+
+    data, columns = DataLoader.load_csv_chunked(file_path)
+
+    assert columns == ['a', 'b', 'c']
+    assert data.shape == (0, 3)
+
+def test_load_csv_chunked_empty_file(tmp_path, csv_parser):
+    file_path = write_text(tmp_path / 'data.csv', "")
+
+    with pytest.raises(ValueError):
+        DataLoader.load_csv_chunked(file_path)
+
+def test_non_numeric_csv_falls_back_to_load_csv(tmp_path, csv_parser):
+    file_path = write_text(tmp_path / 'data.csv', "x,name\n1,foo\n2,bar\n")
+
+    # The streaming loader rejects the file, so the application
+    # reads it with the DataFrame loader instead
+    with pytest.raises(ValueError):
+        DataLoader.load_csv_chunked(file_path)
+
+    frame = DataLoader.load_csv(file_path)
+
+    assert frame.columns.tolist() == ['x', 'name']
+    assert frame['name'].tolist() == ['foo', 'bar']
+
+def test_count_rows_is_upper_bound(tmp_path):
+    file_path = write_text(tmp_path / 'data.csv', "a\n1\n\n2\n")
+
+    assert DataLoader.count_rows(file_path) == 3
+    assert DataLoader.count_rows(write_text(tmp_path / 'empty.csv', "")) == 0
+
+@pytest.fixture
+def excel_file(tmp_path):
+    """Workbook with an empty header cell and formatted empty trailing rows."""
+    openpyxl = pytest.importorskip('openpyxl')
+
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(['a', None, 'c'])
+    sheet.append([1, 2, 3])
+    sheet.append([4, None, 6])
+
+    # Formatted cells without values extend the sheet dimensions
+    sheet.cell(row=10, column=1).number_format = '0.00'
+
+    file_path = str(tmp_path / 'data.xlsx')
+    workbook.save(file_path)
+    return file_path
+
+def test_load_excel_chunked_trims_trailing_rows(excel_file):
+    data, columns = DataLoader.load_excel_chunked(excel_file, dtype=np.float64)
+
+    assert columns == ['a', 'Unnamed: 1', 'c']
+    np.testing.assert_array_equal(data, [[1, 2, 3], [4, np.nan, 6]])
+
+def test_load_excel_matches_chunked(excel_file):
+    frame = DataLoader.load_excel(excel_file)
+    data, columns = DataLoader.load_excel_chunked(excel_file, dtype=np.float64)
+
+    assert frame.columns.tolist() == columns
+    np.testing.assert_array_equal(frame.to_numpy(dtype=np.float64), data)
+
+def test_load_excel_chunked_non_numeric(tmp_path):
+    openpyxl = pytest.importorskip('openpyxl')
+
+    workbook = openpyxl.Workbook()
+    workbook.active.append(['x', 'name'])
+    workbook.active.append([1, 'foo'])
+    file_path = str(tmp_path / 'data.xlsx')
+    workbook.save(file_path)
+
+    with pytest.raises((ValueError, TypeError)):
+        DataLoader.load_excel_chunked(file_path)
+
+def test_load_numpy(tmp_path):
+    expected = np.arange(12, dtype=np.float32).reshape(4, 3)
+    file_path = str(tmp_path / 'data.npy')
+    np.save(file_path, expected)
+
+    np.testing.assert_array_equal(DataLoader.load_numpy(file_path), expected)
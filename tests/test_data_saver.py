@@ -0,0 +1,56 @@
+"""
+Tests of the result file writers.
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip('PyQt5')
+
+from src.ui.data_saver import FILE_WRITERS, _write_results
+
+@pytest.fixture
+def results_df():
+    rng = np.random.default_rng(0)
+    frame = pd.DataFrame(rng.random((20, 2)), columns=['x', 'y'])
+    frame.loc[3, 'y'] = np.nan
+    frame['cluster'] = rng.integers(0, 4, len(frame))
+    return frame
+
+def read_back(file_path, extension):
+    readers = {
+        '.csv': pd.read_csv,
+        '.xlsx': pd.read_excel,
+        '.parquet': pd.read_parquet,
+        '.feather': pd.read_feather,
+    }
+    return readers[extension](file_path)
+
+@pytest.mark.parametrize('extension', ['.csv', '.xlsx', '.parquet', '.feather'])
+def test_table_writers_round_trip(tmp_path, results_df, extension):
+    if extension in ('.parquet', '.feather'):
+        pytest.importorskip('pyarrow')
+
+    if extension == '.xlsx':
+        pytest.importorskip('openpyxl')
+
+    file_path, file_type = _write_results(results_df, str(tmp_path / f'results{extension}'))
+
+    assert file_type == FILE_WRITERS[extension][0]
+    pd.testing.assert_frame_equal(read_back(file_path, extension), results_df, check_dtype=False)
+
+@pytest.mark.parametrize('file_name', ['labels.npy', 'LABELS.NPY'])
+def test_labels_writer_round_trip(tmp_path, results_df, file_name):
+    file_path, _ = _write_results(results_df, str(tmp_path / file_name))
+    labels = np.load(file_path, allow_pickle=False)
+
+    assert file_path.endswith(file_name)
+    assert labels.dtype == np.int16
+    np.testing.assert_array_equal(labels, results_df['cluster'])
+
+def test_unknown_extension_is_written_as_csv(tmp_path, results_df):
+    file_path, _ = _write_results(results_df, str(tmp_path / 'results.txt'))
+
+    assert file_path.endswith('results.txt.csv')
+    pd.testing.assert_frame_equal(pd.read_csv(file_path), results_df, check_dtype=False)
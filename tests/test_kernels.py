@@ -0,0 +1,97 @@
+"""
+Tests of the k-means kernels against scikit-learn.
+"""
+
+import numpy as np
+import pytest
+from sklearn.cluster import KMeans
+from sklearn.datasets import make_blobs
+from sklearn.metrics import silhouette_samples, calinski_harabasz_score, davies_bouldin_score
+from sklearn.metrics.pairwise import euclidean_distances
+from src.clustering import _kernels
+
+@pytest.fixture(params=[True, False], ids=['numba', 'numpy'])
+def use_numba(request, monkeypatch):
+    """Run a test with the Numba kernels and with the NumPy fallback."""
+
+    if request.param and not _kernels.NUMBA_AVAILABLE:
+        pytest.skip("numba is not installed")
+
+    monkeypatch.setattr(_kernels, 'NUMBA_AVAILABLE', request.param)
+    return request.param
+
+def blobs(n_samples=600, n_features=2, n_clusters=4):
+    X, _ = make_blobs(n_samples=n_samples, n_features=n_features, centers=n_clusters, random_state=0)
+    return X
+
+def cluster_index(labels):
+    _, inverse, counts = np.unique(labels, return_inverse=True, return_counts=True)
+    return inverse.ravel(), counts
+
+# 2 and 4 features use the kernels compiled for a fixed width, 5 the generic one
+@pytest.mark.parametrize('n_features', [2, 4, 5])
+@pytest.mark.parametrize('dtype', [np.float64, np.float32])
+def test_lloyd_matches_sklearn(use_numba, n_features, dtype):
+    X = blobs(n_features=n_features).astype(dtype)
+    init = X[[0, 150, 300, 450]]
+
+    labels, centers, inertia, _ = _kernels.lloyd(X, init.copy(), max_iter=100, tol=1e-6)
+    reference = KMeans(n_clusters=4, init=init, n_init=1, max_iter=100, tol=1e-6, algorithm='lloyd').fit(X)
+
+    np.testing.assert_array_equal(labels, reference.labels_)
+    np.testing.assert_allclose(centers, reference.cluster_centers_, rtol=1e-4, atol=1e-4)
+    assert inertia == pytest.approx(reference.inertia_, rel=1e-4)
+
+def test_assign_labels_matches_nearest_center(use_numba):
+    X = blobs(n_features=3)
+    centers = X[:5]
+
+    labels, distances = _kernels.assign_labels(X, centers, _kernels.squared_norms(X))
+    squared = euclidean_distances(X, centers, squared=True)
+
+    np.testing.assert_array_equal(labels, squared.argmin(axis=1))
+    np.testing.assert_allclose(distances, squared.min(axis=1), atol=1e-8)
+
+@pytest.mark.parametrize('tile_size', [7, 4096])
+def test_silhouette_values_tiled_matches_sklearn(tile_size):
+    X = blobs(n_samples=200)
+    labels = KMeans(n_clusters=4, n_init=1, random_state=0).fit_predict(X)
+    inverse, counts = cluster_index(labels)
+
+    values = _kernels.silhouette_values_tiled(
+        X, inverse, counts,
+        lambda A, B: euclidean_distances(A, B, squared=True),
+        tile_size=tile_size
+    )
+
+    np.testing.assert_allclose(values, silhouette_samples(X, labels), atol=1e-8)
+
+@pytest.mark.skipif(not _kernels.NUMBA_AVAILABLE, reason="numba is not installed")
+def test_silhouette_values_fused_matches_sklearn():
+    X = blobs(n_samples=200)
+    labels = KMeans(n_clusters=4, n_init=1, random_state=0).fit_predict(X)
+    inverse, counts = cluster_index(labels)
+
+    values = _kernels.silhouette_values_fused(X, inverse, counts)
+
+    np.testing.assert_allclose(values, silhouette_samples(X, labels), atol=1e-8)
+
+def test_silhouette_of_singleton_cluster_is_zero():
+    X = np.array([[0.0], [0.1], [5.0]])
+    inverse, counts = cluster_index(np.array([0, 0, 1]))
+
+    values = _kernels.silhouette_values_tiled(X, inverse, counts, lambda A, B: euclidean_distances(A, B, squared=True))
+
+    np.testing.assert_allclose(values, silhouette_samples(X, [0, 0, 1]))
+    assert values[2] == 0
+
+@pytest.mark.parametrize('n_clusters', [2, 5])
+def test_centroid_scores_match_sklearn(n_clusters):
+    X = blobs(n_features=3)
+    labels = KMeans(n_clusters=n_clusters, n_init=1, random_state=0).fit_predict(X)
+    inverse, counts = cluster_index(labels)
+
+    calinski_harabasz, davies_bouldin = _kernels.centroid_scores(X, inverse, counts)
+
+    assert calinski_harabasz == pytest.approx(calinski_harabasz_score(X, labels))
+    assert davies_bouldin == pytest.approx(davies_bouldin_score(X, labels))
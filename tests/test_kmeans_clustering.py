@@ -0,0 +1,56 @@
+"""
+Tests of the K-means clustering model.
+"""
+
+import numpy as np
+import pytest
+from sklearn.cluster import KMeans
+from sklearn.datasets import make_blobs
+from src.clustering.kmeans_clustering import KMeansClustering
+from src.clustering.cluster_analyzer import ClusterAnalyzer
+
+@pytest.fixture
+def X():
+    X, _ = make_blobs(n_samples=500, n_features=3, centers=4, random_state=0)
+    return X
+
+@pytest.mark.parametrize('backend', ['sklearn', 'numpy'])
+def test_optimal_k_elbow_k1_is_closed_form(X, backend):
+    k_range, inertia = KMeansClustering(backend=backend).optimal_k_elbow(X, k_range=[1])
+    reference = KMeans(n_clusters=1, n_init=1).fit(X).inertia_
+
+    assert k_range == [1]
+    assert inertia[0] == pytest.approx(np.sum((X - X.mean(axis=0)) ** 2))
+    assert inertia[0] == pytest.approx(reference)
+
+@pytest.mark.parametrize('warm_start', [False, True])
+def test_optimal_k_elbow_parallel(X, warm_start):
+    k_range, inertia = KMeansClustering(backend='numpy').optimal_k_elbow(
+        X, k_range=range(1, 7), n_jobs=2, warm_start=warm_start
+    )
+
+    assert k_range == list(range(1, 7))
+    assert len(inertia) == 6
+
+    # The blobs have four clusters, so the curve bends at k = 4
+    assert inertia[3] < inertia[2] < inertia[1] < inertia[0]
+    assert inertia[3] == pytest.approx(KMeans(n_clusters=4, n_init=10, random_state=0).fit(X).inertia_, rel=1e-3)
+
+def test_evaluate_reflects_in_place_changes(X):
+    model = KMeansClustering(n_clusters=4, random_state=0, backend='numpy').fit(X)
+    labels = model.labels_.copy()
+    before = model.evaluate(X, labels)
+
+    # Merging two clusters of the same arrays must change the scores
+    labels[labels == 3] = 2
+    after = model.evaluate(X, labels)
+
+    assert after['calinski_harabasz_score'] != before['calinski_harabasz_score']
+    assert after['silhouette_score'] != before['silhouette_score']
+
+def test_cluster_sizes_follow_in_place_changes():
+    labels = np.array([0, 1, 1, 2])
+    assert ClusterAnalyzer.get_cluster_sizes(labels) == {0: 1, 1: 2, 2: 1}
+
+    labels[0] = 1
+    assert ClusterAnalyzer.get_cluster_sizes(labels) == {1: 3, 2: 1}
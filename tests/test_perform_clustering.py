@@ -0,0 +1,60 @@
+"""
+Tests of the result caches of the clustering interface.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+import numpy as np
+import pytest
+
+pytest.importorskip('PyQt5')
+
+from src.ui._perform_clustering import _on_preprocessing_done
+
+@pytest.fixture
+def app():
+    """Application state with cached results of the current data."""
+    return SimpleNamespace(
+        preprocess_btn=MagicMock(),
+        action_preprocess=MagicMock(),
+        results_text=MagicMock(),
+        translator=lambda key: key,
+        processed_data=np.zeros((3, 2)),
+        reduced_data=None,
+        _vis_2d=None,
+        _pca_components=None,
+        _pca_mean=None,
+        _results_df_cache=object(),
+        _processed_data_f32=np.zeros((3, 2), dtype=np.float32),
+        _data_generation=1,
+        _elbow_cache={(1, (1, 2), 'numpy'): ([1, 2], [2.0, 1.0])},
+        _clustering_cache={(1, 3, 300, 'numpy', False): {}},
+    )
+
+def preprocessing_result():
+    processed = np.ones((3, 2))
+    return processed, processed, processed, None, None
+
+def test_preprocessing_invalidates_caches(app):
+    result = preprocessing_result()
+
+    _on_preprocessing_done(app, 1, result)
+
+    assert app.processed_data is result[0]
+    assert app._data_generation == 2
+    assert app._elbow_cache == {}
+    assert app._clustering_cache == {}
+    assert app._processed_data_f32 is None
+    assert app._results_df_cache is None
+    app.preprocess_btn.setEnabled.assert_called_with(True)
+
+def test_preprocessing_of_replaced_data_is_discarded(app):
+    processed_data = app.processed_data
+    elbow_cache = dict(app._elbow_cache)
+
+    _on_preprocessing_done(app, 0, preprocessing_result())
+
+    assert app.processed_data is processed_data
+    assert app._data_generation == 1
+    assert app._elbow_cache == elbow_cache
+    app.preprocess_btn.setEnabled.assert_called_with(True)